@@ -0,0 +1,12 @@
+from conf_manager.api import apply_overrides, build_override_set
+from conf_manager.override.processor import Override, OverrideSet, TargetResult
+from conf_manager.override.schema import OverrideValidationError
+
+__all__ = [
+    'apply_overrides',
+    'build_override_set',
+    'Override',
+    'OverrideSet',
+    'OverrideValidationError',
+    'TargetResult',
+]
@@ -0,0 +1,60 @@
+import os
+from typing import Any, Iterable, List, Mapping, Optional, Sequence, Union
+from conf_manager.config.manager import ConfigManager
+from conf_manager.override.processor import Override, OverrideSet, TargetResult
+
+OverrideRows = Iterable[Sequence[Any]]
+OverrideColumns = Mapping[str, Sequence[Any]]
+
+COLUMNS = ('target', 'section', 'key', 'value')
+
+def iter_override_rows(overrides: Union[OverrideRows, OverrideColumns]) -> OverrideRows:
+    """Yield (target, section, key, value[, priority]) rows from either input layout."""
+    if not isinstance(overrides, Mapping):
+        return overrides
+    missing = [name for name in COLUMNS if name not in overrides]
+    if missing:
+        raise ValueError(f"Override columns missing: {', '.join(missing)}")
+    columns = [overrides[name] for name in COLUMNS]
+    if 'priority' in overrides:
+        columns.append(overrides['priority'])
+    if len({len(column) for column in columns}) > 1:
+        raise ValueError("Override columns must all have the same length")
+    return zip(*columns)
+
+def build_override_set(config_dir: str, overrides: Union[OverrideRows, OverrideColumns]) -> OverrideSet:
+    """Build an OverrideSet from rows or columns; targets are relative to config_dir."""
+    target_paths = {}
+
+    def resolve(target: str) -> str:
+        full_target_path = target_paths.get(target)
+        if full_target_path is None:
+            full_target_path = target_paths[target] = os.path.join(config_dir, target)
+        return full_target_path
+
+    def make_override(index: int, row: Sequence[Any]) -> Override:
+        if len(row) not in (4, 5):
+            raise ValueError(f"Override row {index} has {len(row)} field(s), expected "
+                             f"(target, section, key, value[, priority])")
+        return Override(resolve(row[0]), *row[1:])
+
+    override_set = OverrideSet()
+    override_set.add_overrides(make_override(index, row) for index, row in enumerate(iter_override_rows(overrides)))
+    return override_set
+
+def apply_overrides(config_dir: str, overrides: Union[OverrideRows, OverrideColumns, OverrideSet],
+                    dry_run: bool = False, engine: str = 'sync', concurrency: Optional[int] = None,
+                    lock_timeout: Optional[float] = None, schema_path: Optional[str] = None) -> List[TargetResult]:
+    """Apply in-memory overrides to the config files in config_dir.
+
+    `overrides` is an OverrideSet, an iterable of (target, section, key, value)
+    or (target, section, key, value, priority) tuples, or a mapping of equally
+    long 'target', 'section', 'key', 'value' and optional 'priority' columns.
+    Returns one TargetResult per target file; invalid overrides raise
+    OverrideValidationError before any file is touched.
+    """
+    if not isinstance(overrides, OverrideSet):
+        overrides = build_override_set(config_dir, overrides)
+    config_manager = ConfigManager(None, config_dir, lock_timeout=lock_timeout, engine=engine,
+                                   concurrency=concurrency, schema_path=schema_path)
+    return config_manager.apply_override_set(overrides, dry_run)
@@ -1,30 +1,61 @@
 import yaml
 import os
 import re
+from conf_manager.file.file_manager import FileManager
 
 class ConfigConverter:
     def convert_to_override(self, config_file, override_dir):
-        # Read the config file
-        with open(config_file, 'r') as f:
-            content = f.read()
+        config_dict = self.parse_config_file(config_file)
+        return self.write_override(config_dict, config_file, override_dir)
 
-        # Parse the config file
+    def diff_to_override(self, baseline_file, config_file, override_dir):
+        # Only emit the (section, key) pairs that differ from the baseline
+        if FileManager().files_equal(baseline_file, config_file):
+            return self.write_override({}, config_file, override_dir)
+        baseline_dict = self.parse_config_file(baseline_file)
+        config_dict = self.parse_config_file(config_file)
+        diff_dict = self.diff_configs(baseline_dict, config_dict)
+        return self.write_override(diff_dict, config_file, override_dir)
+
+    def parse_config_file(self, config_file):
+        # Scan the raw lines; only section names, keys and values are decoded
         config_dict = {}
         current_section = None
-        for line in content.splitlines():
+        for line in FileManager().iter_lines(config_file):
             line = line.strip()
-            if line.startswith('#') or not line:
+            if line.startswith(b'#') or not line:
                 continue
-            if line.startswith('[') and line.endswith(']'):
-                current_section = line[1:-1].strip()
+            if line.startswith(b'[') and line.endswith(b']'):
+                current_section = line[1:-1].strip().decode()
                 config_dict[current_section] = {}
-            elif '=' in line:
-                key, value = map(str.strip, line.split('=', 1))
+            elif b'=' in line:
+                key, value = (part.strip().decode() for part in line.split(b'=', 1))
                 if current_section:
                     config_dict[current_section][key] = value
                 else:
                     config_dict[key] = value
+        return config_dict
+
+    def diff_configs(self, baseline_dict, config_dict):
+        diff_dict = {}
+        for name, value in config_dict.items():
+            baseline_value = baseline_dict.get(name)
+            if isinstance(value, dict):
+                if isinstance(baseline_value, dict):
+                    # Identical sections are skipped with a single dict comparison
+                    if value == baseline_value:
+                        continue
+                    changed = {key: val for key, val in value.items()
+                               if baseline_value.get(key) != val}
+                else:
+                    changed = dict(value)
+                if changed:
+                    diff_dict[name] = changed
+            elif value != baseline_value:
+                diff_dict[name] = value
+        return diff_dict
 
+    def write_override(self, config_dict, config_file, override_dir):
         # Create the YAML content
         yaml_content = yaml.dump(config_dict, default_flow_style=False)
 
@@ -1,94 +1,221 @@
 import os
 import yaml
-from typing import List
+from typing import List, Optional
 from conf_manager.config.parser import ConfigParser
-from conf_manager.override.processor import OverrideProcessor, OverrideSet, Override
+from conf_manager.override.processor import (
+    OverrideProcessor, OverrideSet, Override, TargetResult, log_target_result
+)
+from conf_manager.override.cache import LayerCache, hash_layer_locations, hash_override_files
+from conf_manager.override.async_engine import AsyncOverrideEngine, DEFAULT_CONCURRENCY
+from conf_manager.override.process_engine import ProcessOverrideEngine
+from conf_manager.override.snapshot import OverrideSnapshot, SnapshotError, SNAPSHOT_FILE_NAME
+from conf_manager.override.sources import HttpConnectionPool, is_url, make_source
+from conf_manager.override.schema import (
+    OverrideSchema, OverrideValidationError, check_overrides, validate_override_data
+)
 from conf_manager.file.file_manager import FileManager
 from conf_manager.utils.logging_config import get_logger
+from conf_manager.utils.profiling import Profiler
 
 class ConfigManager:
-    def __init__(self, override_dir: str, config_dir: str):
+    def __init__(self, override_dir: Optional[str], config_dir: str, lock_timeout: Optional[float] = None,
+                 layer_dirs: Optional[List[str]] = None, cache_dir: Optional[str] = None,
+                 engine: str = 'sync', concurrency: Optional[int] = None, snapshot_path: Optional[str] = None,
+                 schema_path: Optional[str] = None, profiler: Optional[Profiler] = None):
         self.override_dir = override_dir
+        # Layers are applied in order; later layers take precedence over earlier ones
+        self.override_dirs = ([override_dir] if override_dir else []) + list(layer_dirs or [])
         self.config_dir = config_dir
+        self.layer_cache = LayerCache(cache_dir) if cache_dir else None
+        self.http_pool = HttpConnectionPool()
+        self.sources = {location: make_source(location, cache_dir, self.http_pool)
+                        for location in self.override_dirs}
+        self.engine = engine
+        self.concurrency = concurrency
+        if not snapshot_path and override_dir and not is_url(override_dir):
+            snapshot_path = os.path.join(override_dir, SNAPSHOT_FILE_NAME)
+        self.snapshot = OverrideSnapshot(snapshot_path) if snapshot_path else None
+        self.schema = OverrideSchema.from_file(schema_path) if schema_path else None
+        self.validation_errors: List[str] = []
+        self.load_errors: List[str] = []
+        self.profiler = profiler or Profiler()
         self.config_parser = ConfigParser()
         self.file_manager = FileManager()
-        self.override_processor = OverrideProcessor(self.config_parser)
+        self.lock_timeout = lock_timeout
+        self.override_processor = OverrideProcessor(self.config_parser, lock_timeout=lock_timeout)
         self.override_set = OverrideSet()
         self.logger = get_logger(__name__)
 
     def run(self, dry_run: bool = False):
         try:
             self.logger.info("Starting configuration management process")
-            self.load_all_overrides()
-            self.apply_all_overrides(dry_run)
+            with self.profiler.phase('load'):
+                self.load_all_overrides()
+            with self.profiler.phase('apply'):
+                self.apply_all_overrides(dry_run)
             self.logger.info("Configuration management process completed")
             return 0  # Success
         except Exception as e:
             self.logger.error(f"Configuration management process failed: {e}")
             return 1  # Failure
+        finally:
+            self.http_pool.close()
 
     def load_all_overrides(self):
-        self.logger.info(f"Loading overrides from directory: {self.override_dir}")
-        override_files = self.get_sorted_override_files()
-        for file_path in override_files:
-            self.process_override_file(file_path)
+        if not self.load_snapshot():
+            self.load_override_layers()
+        self.validate_overrides()
         self.log_total_overrides()
 
-    def get_sorted_override_files(self):
-        return sorted(
-            [os.path.join(self.override_dir, f) for f in os.listdir(self.override_dir)
-             if f.endswith(('.yaml', '.yml'))]
-        )
+    def validate_overrides(self):
+        # Runs before any target is touched, so a bad override aborts the whole run
+        errors = list(self.validation_errors)
+        if self.schema:
+            errors.extend(self.schema.validate(self.get_all_overrides(), self.config_dir))
+        if errors:
+            for error in errors:
+                self.logger.error(f"Invalid override: {error}")
+            raise OverrideValidationError(errors)
+
+    def load_snapshot(self) -> bool:
+        if not self.snapshot or not self.snapshot.exists():
+            return False
+        try:
+            overrides = self.snapshot.load(self.compute_source_hash())
+        except SnapshotError as e:
+            self.logger.warning(f"{e}; falling back to parsing override files")
+            return False
+        self.logger.info(f"Loaded overrides from snapshot: {self.snapshot.snapshot_path}")
+        for override in overrides:
+            self.override_set.add_override(override)
+        return True
+
+    def compile_snapshot(self) -> str:
+        if not self.snapshot:
+            raise ValueError("A snapshot path is required when the first override layer is a URL")
+        try:
+            with self.profiler.phase('load'):
+                source_hash = self.compute_source_hash()
+                self.load_override_layers()
+                # A snapshot built without a broken file would hide that file from every later run
+                if self.load_errors:
+                    raise SnapshotError(f"Cannot compile snapshot, {len(self.load_errors)} override file(s) "
+                                        f"failed to load:\n" + "\n".join(self.load_errors))
+                self.validate_overrides()
+                self.log_total_overrides()
+        finally:
+            self.http_pool.close()
+        self.snapshot.write(self.get_all_overrides(), source_hash)
+        self.logger.info(f"Wrote override snapshot: {self.snapshot.snapshot_path}")
+        return self.snapshot.snapshot_path
+
+    def compute_source_hash(self) -> str:
+        layer_files = [self.get_sorted_override_files(override_dir) for override_dir in self.override_dirs]
+        return hash_override_files(layer_files, self.config_dir)
+
+    def load_override_layers(self):
+        base_layers = self.override_dirs[:-1]
+        if base_layers and self.layer_cache:
+            self.load_cached_layers(base_layers)
+        else:
+            for priority, override_dir in enumerate(base_layers):
+                self.load_layer(override_dir, priority)
+        self.load_layer(self.override_dirs[-1], len(self.override_dirs) - 1)
 
-    def process_override_file(self, file_path):
+    def load_layer(self, override_dir: str, priority: int = 0):
+        if is_url(override_dir):
+            self.logger.info(f"Loading overrides from URL: {override_dir}")
+        else:
+            self.logger.info(f"Loading overrides from directory: {override_dir}")
+        override_files = self.get_sorted_override_files(override_dir)
+        for file_path in override_files:
+            self.process_override_file(file_path, priority)
+
+    def load_cached_layers(self, layer_dirs: List[str]):
+        layer_files = [self.get_sorted_override_files(override_dir) for override_dir in layer_dirs]
+        cache_key = hash_layer_locations(layer_dirs, self.config_dir)
+        content_hash = hash_override_files(layer_files, self.config_dir)
+        cached_overrides = self.layer_cache.load(cache_key, content_hash)
+        if cached_overrides is not None:
+            self.logger.info(f"Loaded {len(cached_overrides)} overrides for {len(layer_dirs)} base layer(s) from cache")
+            for override in cached_overrides:
+                self.override_set.add_override(override)
+            return
+
+        for priority, override_dir in enumerate(layer_dirs):
+            self.load_layer(override_dir, priority)
+        # A file that failed to load would otherwise be silently missing from every cached run
+        if not self.validation_errors and not self.load_errors:
+            self.layer_cache.store(cache_key, content_hash, self.get_all_overrides())
+
+    def get_sorted_override_files(self, override_dir: Optional[str] = None):
+        return self.sources[override_dir or self.override_dir].get_override_files()
+
+    def process_override_file(self, file_path, priority: int = 0):
         self.logger.debug(f"Processing file: {file_path}")
         try:
             override_data = self.load_yaml_file(file_path)
             if self.is_valid_override_data(override_data):
-                self.add_overrides_from_data(override_data)
+                errors = validate_override_data(override_data, file_path)
+                if errors:
+                    self.validation_errors.extend(errors)
+                else:
+                    self.add_overrides_from_data(override_data, priority)
             else:
                 self.logger.warning(f"No valid overrides found in {file_path}")
         except yaml.YAMLError as e:
             self.logger.error(f"Error parsing YAML file {file_path}: {e}")
+            self.load_errors.append(f"{file_path}: {e}")
         except Exception as e:
             self.logger.error(f"Unexpected error processing {file_path}: {e}")
+            self.load_errors.append(f"{file_path}: {e}")
 
     def load_yaml_file(self, file_path):
         with open(file_path, 'r') as f:
             return yaml.safe_load(f)
 
     def is_valid_override_data(self, override_data):
-        return override_data and 'overrides' in override_data
+        return isinstance(override_data, dict) and 'overrides' in override_data
 
-    def add_overrides_from_data(self, override_data):
+    def add_overrides_from_data(self, override_data, priority: int = 0):
         for target_file, sections in override_data['overrides'].items():
             full_target_path = os.path.join(self.config_dir, target_file)
             for section, keys in sections.items():
                 for key, value in keys.items():
-                    override = Override(full_target_path, section, key, value)
+                    override = Override(full_target_path, section, key, value, priority)
                     self.override_set.add_override(override)
                     self.logger.debug(f"Added override: {override}")
 
+    def get_all_overrides(self) -> List[Override]:
+        return [override for overrides in self.override_set.overrides.values() for override in overrides]
+
     def log_total_overrides(self):
         total_overrides = sum(len(overrides) for overrides in self.override_set.overrides.values())
         self.logger.info(f"Total overrides loaded: {total_overrides}")
 
-    def apply_all_overrides(self, dry_run: bool):
-        for target_file in self.get_unique_target_files():
-            self.apply_overrides_to_file(target_file, dry_run)
+    def apply_override_set(self, override_set: OverrideSet, dry_run: bool = False) -> List[TargetResult]:
+        # Entry point for overrides built in memory; the override directories are never read
+        self.override_set = override_set
+        self.validation_errors = check_overrides(self.get_all_overrides())
+        self.validate_overrides()
+        self.log_total_overrides()
+        with self.profiler.phase('apply'):
+            return self.apply_all_overrides(dry_run)
+
+    def apply_all_overrides(self, dry_run: bool) -> List[TargetResult]:
+        if self.engine == 'async':
+            engine = AsyncOverrideEngine(self.override_processor, self.concurrency or DEFAULT_CONCURRENCY)
+            return engine.run(self.override_set, sorted(self.get_unique_target_files()), dry_run)
+        if self.engine == 'process':
+            engine = ProcessOverrideEngine(lock_timeout=self.lock_timeout, workers=self.concurrency)
+            return engine.run(self.override_set, sorted(self.get_unique_target_files()), dry_run)
+        return [self.apply_overrides_to_file(target_file, dry_run)
+                for target_file in sorted(self.get_unique_target_files())]
 
     def get_unique_target_files(self):
         return set(override.target_file for overrides in self.override_set.overrides.values() for override in overrides)
 
-    def apply_overrides_to_file(self, target_file: str, dry_run: bool):
-        if os.path.exists(target_file):
-            if not dry_run:
-                try:
-                    self.override_processor.process(self.override_set, target_file)
-                    self.logger.info(f"Applied overrides to {target_file}")
-                except Exception as e:
-                    self.logger.error(f"Error applying overrides to {target_file}: {e}")
-            else:
-                self.logger.info(f"Would apply overrides to {target_file}")
-        else:
-            self.logger.warning(f"Target file does not exist: {target_file}")
+    def apply_overrides_to_file(self, target_file: str, dry_run: bool) -> TargetResult:
+        result = self.override_processor.apply_to_target(self.override_set, target_file, dry_run)
+        log_target_result(self.logger, result)
+        return result
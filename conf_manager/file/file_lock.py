@@ -0,0 +1,64 @@
+import fcntl
+import os
+import time
+from typing import Optional
+
+class FileLockTimeout(TimeoutError):
+    pass
+
+class FileLock:
+    """Advisory exclusive lock (flock) on a single target file.
+
+    The lock is taken on the target itself, so writers that reopen the file
+    with 'w' keep the same inode and the lock stays effective across a
+    parse -> apply -> save cycle.
+    """
+
+    def __init__(self, file_path: str, timeout: Optional[float] = None, poll_interval: float = 0.05):
+        self.file_path = file_path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.wait_time = 0.0
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> float:
+        fd = os.open(self.file_path, os.O_RDONLY)
+        start = time.monotonic()
+        try:
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    elapsed = time.monotonic() - start
+                    if self.timeout is not None and elapsed >= self.timeout:
+                        raise FileLockTimeout(
+                            f"Timed out after {elapsed:.3f}s waiting for lock on {self.file_path}")
+                    time.sleep(self.poll_interval)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+        self.wait_time = time.monotonic() - start
+        return self.wait_time
+
+    def release(self):
+        if self._fd is None:
+            return
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    @property
+    def is_locked(self) -> bool:
+        return self._fd is not None
+
+    def __enter__(self):
+        if not self.is_locked:
+            self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
@@ -1,7 +1,16 @@
+import hashlib
+import mmap
 import os
 import shutil
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Union
+
+# Files at least this large are hashed and compared in chunks over an mmap
+# instead of being read into memory in one go
+STREAM_THRESHOLD = 1024 * 1024
+CHUNK_SIZE = 1024 * 1024
 
 class FileManager:
     def read_file(self, file_path: str) -> str:
@@ -12,6 +21,63 @@ class FileManager:
         except IOError as e:
             raise IOError(f"Error reading file {file_path}: {e}")
 
+    def read_bytes(self, file_path: str) -> bytes:
+        self._ensure_file_exists(file_path)
+        try:
+            with open(file_path, 'rb') as file:
+                return file.read()
+        except IOError as e:
+            raise IOError(f"Error reading file {file_path}: {e}")
+
+    @contextmanager
+    def map_file(self, file_path: str) -> Iterator[Union[mmap.mmap, bytes]]:
+        """Read-only, zero-copy view of a file's bytes (empty files cannot be mapped)."""
+        self._ensure_file_exists(file_path)
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                yield b''
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+    def hash_file(self, file_path: str, algorithm: str = 'sha256') -> str:
+        digest = hashlib.new(algorithm)
+        self.update_hash(digest, file_path)
+        return digest.hexdigest()
+
+    def update_hash(self, digest, file_path: str):
+        if os.path.getsize(file_path) < STREAM_THRESHOLD:
+            digest.update(self.read_bytes(file_path))
+            return
+        with self.map_file(file_path) as data, memoryview(data) as view:
+            for offset in range(0, len(view), CHUNK_SIZE):
+                with view[offset:offset + CHUNK_SIZE] as chunk:
+                    digest.update(chunk)
+
+    def files_equal(self, file_path: str, other_path: str) -> bool:
+        self._ensure_file_exists(file_path)
+        self._ensure_file_exists(other_path)
+        if os.path.samefile(file_path, other_path):
+            return True
+        size = os.path.getsize(file_path)
+        if size != os.path.getsize(other_path):
+            return False
+        if size < STREAM_THRESHOLD:
+            return self.read_bytes(file_path) == self.read_bytes(other_path)
+        with self.map_file(file_path) as data, self.map_file(other_path) as other_data:
+            return all(data[offset:offset + CHUNK_SIZE] == other_data[offset:offset + CHUNK_SIZE]
+                       for offset in range(0, size, CHUNK_SIZE))
+
+    def iter_lines(self, file_path: str) -> Iterator[bytes]:
+        with self.map_file(file_path) as data:
+            if not data:
+                return
+            while True:
+                line = data.readline()
+                if not line:
+                    break
+                yield line
+
     def write_file(self, file_path: str, content: str):
         try:
             with open(file_path, 'w') as file:
@@ -21,6 +87,17 @@ class FileManager:
         except IOError as e:
             raise IOError(f"Error writing to file {file_path}: {e}")
 
+    def write_atomic(self, file_path: str, data: bytes):
+        """Write via a temporary file and rename, so readers never see a partial file."""
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(file_path)), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(data)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
     def backup_file(self, file_path: str) -> str:
         self._ensure_file_exists(file_path)
         original_path = Path(file_path)
@@ -4,12 +4,19 @@ import logging
 from conf_manager.config.manager import ConfigManager
 from conf_manager.config.converter import ConfigConverter
 from conf_manager.utils.logging_config import setup_logging
+from conf_manager.utils.profiling import Profiler, PHASES
 
 @click.group()
 @click.option('--dry-run', '-d', is_flag=True, help='Perform a dry run without making changes')
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
+@click.option('--profile-cpu', type=click.Path(dir_okay=False), default=None,
+              help='Write a cProfile .pstats file for the command to this path')
+@click.option('--profile-mem', type=click.Path(dir_okay=False), default=None,
+              help='Write a tracemalloc top-allocations report for the command to this path')
+@click.option('--profile-phase', 'profile_phases', multiple=True, type=click.Choice(PHASES),
+              help='Only profile the given phase (repeatable, default: the whole command)')
 @click.pass_context
-def cli(ctx, dry_run, verbose):
+def cli(ctx, dry_run, verbose, profile_cpu, profile_mem, profile_phases):
     ctx.ensure_object(dict)
     ctx.obj['DRY_RUN'] = dry_run
     ctx.obj['VERBOSE'] = verbose
@@ -17,33 +24,100 @@ def cli(ctx, dry_run, verbose):
     log_level = logging.DEBUG if verbose else logging.INFO
     setup_logging(level=log_level)
 
-def main(override_dir, config_dir, dry_run, verbose):
+    profiler = Profiler(cpu_file=profile_cpu, mem_file=profile_mem, phases=profile_phases)
+    ctx.obj['PROFILER'] = profiler
+    if profiler.enabled:
+        # Registered first so the reports are written after the command phase has ended
+        ctx.call_on_close(profiler.write)
+        ctx.with_resource(profiler.phase('command'))
+
+def main(override_dir, config_dir, dry_run, verbose, lock_timeout=None, layer_dirs=None, cache_dir=None,
+         engine='sync', concurrency=None, snapshot_path=None, schema_path=None, profiler=None):
     if not override_dir or not config_dir:
         click.echo("Error: Both override directory and config directory must be provided.")
         return 1  # Failure
 
-    config_manager = ConfigManager(override_dir, config_dir)
+    try:
+        config_manager = ConfigManager(override_dir, config_dir, lock_timeout=lock_timeout,
+                                       layer_dirs=layer_dirs, cache_dir=cache_dir,
+                                       engine=engine, concurrency=concurrency, snapshot_path=snapshot_path,
+                                       schema_path=schema_path, profiler=profiler)
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        return 1  # Failure
     exit_code = config_manager.run(dry_run=dry_run)
     return exit_code
 
 @cli.command()
 @click.argument('from_dir', type=click.Path(exists=True))
 @click.argument('to_dir', type=click.Path(exists=True))
+@click.option('--lock-timeout', type=float, default=None,
+              help='Seconds to wait for the lock on each target file (default: wait forever)')
+@click.option('--layer', '-o', 'layers', multiple=True,
+              help='Additional override directory or HTTP(S) URL applied on top of FROM_DIR '
+                   '(repeatable, later layers win)')
+@click.option('--cache-dir', type=click.Path(file_okay=False), default=None,
+              help='Directory for caching fetched overrides and the merged result of the lower layers')
+@click.option('--engine', type=click.Choice(['sync', 'async', 'process']), default='sync',
+              help='Apply engine; async overlaps file I/O across targets (for network filesystems), '
+                   'process spreads CPU-bound targets over worker processes')
+@click.option('--concurrency', type=click.IntRange(min=1), default=None,
+              help='Targets in flight for the async engine (default: 16) or worker processes '
+                   'for the process engine (default: CPU count)')
+@click.option('--snapshot', 'snapshot_path', type=click.Path(dir_okay=False), default=None,
+              help='Compiled override snapshot to use when up to date (default: FROM_DIR/.overrides.snapshot)')
+@click.option('--schema', 'schema_path', type=click.Path(exists=True, dir_okay=False), default=None,
+              help='YAML schema restricting the sections, keys and values overrides may set')
 @click.pass_context
-def override(ctx, from_dir, to_dir):
+def override(ctx, from_dir, to_dir, lock_timeout, layers, cache_dir, engine, concurrency, snapshot_path,
+             schema_path):
     """Apply overrides FROM a directory TO another directory."""
-    exit_code = main(from_dir, to_dir, ctx.obj['DRY_RUN'], ctx.obj['VERBOSE'])
+    exit_code = main(from_dir, to_dir, ctx.obj['DRY_RUN'], ctx.obj['VERBOSE'], lock_timeout=lock_timeout,
+                     layer_dirs=list(layers), cache_dir=cache_dir, engine=engine, concurrency=concurrency,
+                     snapshot_path=snapshot_path, schema_path=schema_path, profiler=ctx.obj['PROFILER'])
     sys.exit(exit_code)
 
+@cli.command('compile')
+@click.argument('from_dir', type=click.Path(exists=True))
+@click.argument('to_dir', type=click.Path(exists=True))
+@click.option('--layer', '-o', 'layers', multiple=True,
+              help='Additional override directory or HTTP(S) URL applied on top of FROM_DIR '
+                   '(repeatable, later layers win)')
+@click.option('--snapshot', 'snapshot_path', type=click.Path(dir_okay=False), default=None,
+              help='Where to write the snapshot (default: FROM_DIR/.overrides.snapshot)')
+@click.option('--schema', 'schema_path', type=click.Path(exists=True, dir_okay=False), default=None,
+              help='YAML schema the overrides must satisfy before they are compiled')
+@click.option('--cache-dir', type=click.Path(file_okay=False), default=None,
+              help='Directory for caching overrides fetched from HTTP(S) layers')
+@click.pass_context
+def compile_overrides(ctx, from_dir, to_dir, layers, snapshot_path, schema_path, cache_dir):
+    """Compile the overrides FROM a directory for TO directory into a binary snapshot."""
+    try:
+        config_manager = ConfigManager(from_dir, to_dir, layer_dirs=list(layers), cache_dir=cache_dir,
+                                       snapshot_path=snapshot_path, schema_path=schema_path,
+                                       profiler=ctx.obj['PROFILER'])
+        snapshot_file = config_manager.compile_snapshot()
+        click.echo(f"Override snapshot written to: {snapshot_file}")
+        sys.exit(0)  # Success
+    except Exception as e:
+        click.echo(f"Error compiling overrides: {e}", err=True)
+        sys.exit(1)  # Failure
+
 @cli.command()
 @click.argument('from_file', type=click.Path(exists=True))
 @click.argument('to_dir', type=click.Path(exists=True))
+@click.option('--baseline', '-b', type=click.Path(exists=True), default=None,
+              help='Only emit keys that differ from this baseline config file')
 @click.pass_context
-def convert(ctx, from_file, to_dir):
+def convert(ctx, from_file, to_dir, baseline):
     """Convert a config file FROM one format TO an override YAML file in the specified directory."""
     converter = ConfigConverter()
     try:
-        yaml_file = converter.convert_to_override(from_file, to_dir)
+        with ctx.obj['PROFILER'].phase('convert'):
+            if baseline:
+                yaml_file = converter.diff_to_override(baseline, from_file, to_dir)
+            else:
+                yaml_file = converter.convert_to_override(from_file, to_dir)
         click.echo(f"Config file converted and saved as: {yaml_file}")
         sys.exit(0)  # Success
     except Exception as e:
@@ -0,0 +1,65 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List
+from conf_manager.override.processor import OverrideProcessor, OverrideSet, TargetResult, log_target_result
+from conf_manager.utils.logging_config import get_logger
+
+DEFAULT_CONCURRENCY = 16
+
+class AsyncOverrideEngine:
+    """Applies overrides to many targets concurrently.
+
+    Every blocking step (stat, lock, parse, write) runs in a thread pool, so on
+    high-latency filesystems the stages of different targets overlap instead of
+    being paid one after another. At most `concurrency` targets are in flight.
+    """
+
+    def __init__(self, override_processor: OverrideProcessor, concurrency: int = DEFAULT_CONCURRENCY):
+        if concurrency < 1:
+            raise ValueError(f"Concurrency must be at least 1, got {concurrency}")
+        self.override_processor = override_processor
+        self.concurrency = concurrency
+        self.logger = get_logger(__name__)
+
+    def run(self, override_set: OverrideSet, target_files: Iterable[str], dry_run: bool = False) -> List[TargetResult]:
+        return asyncio.run(self.apply_all(override_set, target_files, dry_run))
+
+    async def apply_all(self, override_set: OverrideSet, target_files: Iterable[str],
+                        dry_run: bool) -> List[TargetResult]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='conf-manager') as executor:
+            return await asyncio.gather(*(
+                self.apply_to_file(override_set, target_file, dry_run, semaphore, executor)
+                for target_file in target_files
+            ))
+
+    async def apply_to_file(self, override_set: OverrideSet, target_file: str, dry_run: bool,
+                            semaphore: asyncio.Semaphore, executor: ThreadPoolExecutor) -> TargetResult:
+        processor = self.override_processor
+        async with semaphore:
+            exists = await self.offload(executor, os.path.exists, target_file)
+            result = processor.check_target(override_set, target_file, exists, dry_run)
+            if result is None:
+                try:
+                    await self.process(override_set, target_file, executor)
+                    result = processor.finish_target(override_set, target_file)
+                except Exception as e:
+                    result = processor.finish_target(override_set, target_file, e)
+        log_target_result(self.logger, result)
+        return result
+
+    async def process(self, override_set: OverrideSet, target_file: str, executor: ThreadPoolExecutor):
+        # Same steps as OverrideProcessor.process, with every blocking one offloaded
+        processor = self.override_processor
+        lock = await self.offload(executor, processor.lock_target, target_file)
+        try:
+            config_data = await self.offload(executor, processor.load_config_data, target_file)
+            processor.render(config_data, override_set, target_file)
+            await self.offload(executor, processor.save_config_data, config_data, target_file)
+        finally:
+            await self.offload(executor, lock.release)
+
+    async def offload(self, executor: ThreadPoolExecutor, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, func, *args)
@@ -0,0 +1,71 @@
+import hashlib
+import json
+import os
+from typing import List, Optional
+from conf_manager.file.file_manager import FileManager
+from conf_manager.override.processor import Override, decode_value, encode_value
+from conf_manager.utils.logging_config import get_logger
+
+def hash_override_files(layers: List[List[str]], *extra: str) -> str:
+    """Content hash of the override files in each layer, plus any extra context."""
+    digest = hashlib.sha256()
+    file_manager = FileManager()
+    for value in extra:
+        digest.update(value.encode())
+        digest.update(b'\0')
+    for layer_files in layers:
+        digest.update(b'\x1elayer\0')
+        for file_path in layer_files:
+            digest.update(os.path.basename(file_path).encode())
+            digest.update(b'\0')
+            file_manager.update_hash(digest, file_path)
+            digest.update(b'\0')
+    return digest.hexdigest()
+
+def hash_layer_locations(layer_dirs: List[str], *extra: str) -> str:
+    """Hash of which layers are loaded (not what they contain), used to name a cache file."""
+    digest = hashlib.sha256()
+    for value in list(extra) + list(layer_dirs):
+        digest.update(value.encode())
+        digest.update(b'\0')
+    return digest.hexdigest()[:16]
+
+class LayerCache:
+    """On-disk cache of merged overrides.
+
+    There is one cache file per list of layers, holding the content hash it was
+    built from, so editing a layer replaces its cache file instead of adding one.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self.logger = get_logger(__name__)
+
+    def cache_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"layers-{key}.json")
+
+    def load(self, key: str, content_hash: str) -> Optional[List[Override]]:
+        cache_path = self.cache_path(key)
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, 'r') as f:
+                data = json.load(f)
+            if data['hash'] != content_hash:
+                self.logger.debug(f"Layer cache {cache_path} is stale")
+                return None
+            return [Override(target_file, section, key, decode_value(value), priority)
+                    for target_file, section, key, value, priority in data['overrides']]
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            self.logger.warning(f"Ignoring unreadable layer cache {cache_path}: {e}")
+            return None
+
+    def store(self, key: str, content_hash: str, overrides: List[Override]):
+        entries = [[o.target_file, o.section, o.key, encode_value(o.value), o.priority] for o in overrides]
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Written atomically so concurrent runs never see a partial cache
+            data = json.dumps({'hash': content_hash, 'overrides': entries})
+            FileManager().write_atomic(self.cache_path(key), data.encode())
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Could not write layer cache to {self.cache_dir}: {e}")
@@ -0,0 +1,97 @@
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterable, List, Optional, Tuple
+from conf_manager.config.parser import ConfigParser
+from conf_manager.override.processor import (
+    Override, OverrideProcessor, OverrideSet, TargetResult, log_target_result
+)
+from conf_manager.utils.logging_config import get_logger
+
+Shard = List[Tuple[str, List[Override]]]
+
+def apply_shard(shard: Shard, dry_run: bool, lock_timeout: Optional[float]) -> List[TargetResult]:
+    """Worker entry point: apply one shard of targets, given only their overrides."""
+    processor = OverrideProcessor(ConfigParser(), lock_timeout=lock_timeout)
+    results = []
+    for target_file, overrides in shard:
+        override_set = OverrideSet()
+        override_set.add_overrides(overrides)
+        results.append(processor.apply_to_target(override_set, target_file, dry_run))
+    return results
+
+class ProcessOverrideEngine:
+    """Applies overrides in worker processes, for targets whose serialization is CPU-bound.
+
+    Targets are split into shards balanced by estimated cost (file size times
+    override count), and each worker receives only the overrides of its own
+    shard. There are several shards per worker so that results stream back as
+    shards finish and stragglers can be picked up by idle workers.
+    """
+
+    def __init__(self, lock_timeout: Optional[float] = None, workers: Optional[int] = None,
+                 shards_per_worker: int = 4):
+        self.lock_timeout = lock_timeout
+        self.workers = workers or os.cpu_count() or 1
+        self.shards_per_worker = shards_per_worker
+        self.logger = get_logger(__name__)
+
+    def run(self, override_set: OverrideSet, target_files: Iterable[str], dry_run: bool = False) -> List[TargetResult]:
+        if dry_run:
+            # Nothing to serialize, so a stat per target in this process is all it takes
+            return self.check_targets(override_set, target_files)
+
+        shards = self.shard_targets(override_set, target_files)
+        if not shards:
+            return []
+        self.logger.debug(f"Applying overrides in {len(shards)} shard(s) across {self.workers} worker(s)")
+
+        results = []
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(shards))) as executor:
+            futures = {executor.submit(apply_shard, shard, dry_run, self.lock_timeout): shard for shard in shards}
+            for future in as_completed(futures):
+                try:
+                    shard_results = future.result()
+                except Exception as e:
+                    # The worker itself died; report every target of its shard as failed
+                    shard_results = [
+                        TargetResult(target_file, TargetResult.FAILED, len(overrides), f"Worker failed: {e}")
+                        for target_file, overrides in futures[future]
+                    ]
+                for result in shard_results:
+                    log_target_result(self.logger, result)
+                results.extend(shard_results)
+        return sorted(results, key=lambda result: result.target_file)
+
+    def check_targets(self, override_set: OverrideSet, target_files: Iterable[str]) -> List[TargetResult]:
+        processor = OverrideProcessor(ConfigParser(), lock_timeout=self.lock_timeout)
+        results = []
+        for target_file in sorted(target_files):
+            result = processor.apply_to_target(override_set, target_file, dry_run=True)
+            log_target_result(self.logger, result)
+            results.append(result)
+        return results
+
+    def shard_targets(self, override_set: OverrideSet, target_files: Iterable[str]) -> List[Shard]:
+        targets = [(target_file, override_set.get_overrides_for_file(target_file)) for target_file in target_files]
+        shard_count = min(len(targets), self.workers * self.shards_per_worker)
+        if shard_count == 0:
+            return []
+
+        # Longest-processing-time-first: place the most expensive target on the least loaded shard
+        costed = sorted(((self.estimate_cost(target_file, overrides), target_file, overrides)
+                         for target_file, overrides in targets), key=lambda item: item[0], reverse=True)
+        shards: List[Shard] = [[] for _ in range(shard_count)]
+        loads = [(0, index) for index in range(shard_count)]
+        for cost, target_file, overrides in costed:
+            load, index = heapq.heappop(loads)
+            shards[index].append((target_file, overrides))
+            heapq.heappush(loads, (load + cost, index))
+        return shards
+
+    def estimate_cost(self, target_file: str, overrides: List[Override]) -> int:
+        try:
+            size = os.path.getsize(target_file)
+        except OSError:
+            size = 0
+        return max(size, 1) * max(len(overrides), 1)
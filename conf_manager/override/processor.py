@@ -1,10 +1,12 @@
+import datetime
 import os
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import Dict, Iterable, List, Optional
 from conf_manager.config.parser import ConfigParser
+from conf_manager.file.file_lock import FileLock
 from conf_manager.utils.logging_config import get_logger
 
-@dataclass
+@dataclass(slots=True)
 class Override:
     target_file: str
     section: str
@@ -12,6 +14,37 @@ class Override:
     value: str
     priority: int = 0
 
+def encode_value(value):
+    # JSON and marshal have no date types; override values are scalars, so a tagged dict is unambiguous
+    if isinstance(value, datetime.datetime):
+        return {'datetime': value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {'date': value.isoformat()}
+    return value
+
+def decode_value(value):
+    if isinstance(value, dict):
+        if 'datetime' in value:
+            return datetime.datetime.fromisoformat(value['datetime'])
+        return datetime.date.fromisoformat(value['date'])
+    return value
+
+@dataclass
+class TargetResult:
+    APPLIED = 'applied'
+    WOULD_APPLY = 'would_apply'
+    MISSING = 'missing'
+    FAILED = 'failed'
+
+    target_file: str
+    status: str
+    override_count: int = 0
+    error: Optional[str] = None
+
+    @property
+    def failed(self) -> bool:
+        return self.status == self.FAILED
+
 class OverrideSet:
     def __init__(self):
         self.overrides: Dict[str, List[Override]] = {}
@@ -24,28 +57,95 @@ class OverrideSet:
         self.overrides[normalized_path].append(override)
         self.logger.debug(f"Added override: {override}")
 
+    def add_overrides(self, overrides: Iterable[Override]) -> int:
+        # Bulk variant of add_override: paths are normalized once per target and
+        # nothing is logged per override
+        normalized_paths: Dict[str, List[Override]] = {}
+        count = 0
+        for override in overrides:
+            target_overrides = normalized_paths.get(override.target_file)
+            if target_overrides is None:
+                normalized_path = os.path.normpath(override.target_file)
+                target_overrides = self.overrides.setdefault(normalized_path, [])
+                normalized_paths[override.target_file] = target_overrides
+            target_overrides.append(override)
+            count += 1
+        self.logger.debug(f"Added {count} overrides for {len(normalized_paths)} target(s)")
+        return count
+
+    def count_overrides_for_file(self, target_file: str) -> int:
+        return len(self.overrides.get(os.path.normpath(target_file), []))
+
     def get_overrides_for_file(self, target_file: str) -> List[Override]:
         normalized_path = os.path.normpath(target_file)
         overrides = self.overrides.get(normalized_path, [])
         return sorted(overrides, key=lambda x: x.priority)
 
+def log_target_result(logger, result: TargetResult):
+    if result.status == TargetResult.APPLIED:
+        logger.info(f"Applied overrides to {result.target_file}")
+    elif result.status == TargetResult.WOULD_APPLY:
+        logger.info(f"Would apply overrides to {result.target_file}")
+    elif result.status == TargetResult.MISSING:
+        logger.warning(f"Target file does not exist: {result.target_file}")
+    else:
+        logger.error(f"Error applying overrides to {result.target_file}: {result.error}")
+
 class OverrideProcessor:
-    def __init__(self, config_parser: ConfigParser):
+    def __init__(self, config_parser: ConfigParser, lock_timeout: Optional[float] = None):
         self.config_parser = config_parser
+        self.lock_timeout = lock_timeout
         self.logger = get_logger(__name__)
 
     def process(self, override_set: OverrideSet, target_file: str):
         self.ensure_file_exists(target_file)
         self.logger.info(f"Processing overrides for {target_file}")
-        
-        config_data = self.load_config_data(target_file)
-        overrides = override_set.get_overrides_for_file(target_file)
-        
-        self.apply_overrides(config_data, overrides)
-        self.save_config_data(config_data, target_file)
-        
+
+        with self.lock_target(target_file):
+            config_data = self.load_config_data(target_file)
+            self.render(config_data, override_set, target_file)
+            self.save_config_data(config_data, target_file)
+
         self.logger.info(f"Finished processing overrides for {target_file}")
 
+    def lock_target(self, target_file: str) -> FileLock:
+        lock = FileLock(target_file, timeout=self.lock_timeout)
+        lock.acquire()
+        self.log_lock_wait(target_file, lock.wait_time)
+        return lock
+
+    def log_lock_wait(self, target_file: str, wait_time: float):
+        if wait_time >= 0.001:
+            self.logger.info(f"Lock contention on {target_file}: waited {wait_time:.3f}s")
+        else:
+            self.logger.debug(f"Acquired lock on {target_file}")
+
+    def apply_to_target(self, override_set: OverrideSet, target_file: str, dry_run: bool = False) -> TargetResult:
+        result = self.check_target(override_set, target_file, os.path.exists(target_file), dry_run)
+        if result is not None:
+            return result
+        try:
+            self.process(override_set, target_file)
+        except Exception as e:
+            return self.finish_target(override_set, target_file, e)
+        return self.finish_target(override_set, target_file)
+
+    def check_target(self, override_set: OverrideSet, target_file: str, exists: bool,
+                     dry_run: bool) -> Optional[TargetResult]:
+        """Result for a target that needs no processing, or None if it should be processed."""
+        if not exists:
+            return TargetResult(target_file, TargetResult.MISSING, override_set.count_overrides_for_file(target_file))
+        if dry_run:
+            return TargetResult(target_file, TargetResult.WOULD_APPLY, override_set.count_overrides_for_file(target_file))
+        return None
+
+    def finish_target(self, override_set: OverrideSet, target_file: str,
+                      error: Optional[Exception] = None) -> TargetResult:
+        override_count = override_set.count_overrides_for_file(target_file)
+        if error is not None:
+            return TargetResult(target_file, TargetResult.FAILED, override_count, str(error))
+        return TargetResult(target_file, TargetResult.APPLIED, override_count)
+
     def ensure_file_exists(self, target_file: str):
         if not os.path.exists(target_file):
             raise FileNotFoundError(f"The file {target_file} does not exist.")
@@ -53,6 +153,9 @@ class OverrideProcessor:
     def load_config_data(self, target_file: str) -> dict:
         return self.config_parser.parse(target_file)
 
+    def render(self, config_data: dict, override_set: OverrideSet, target_file: str):
+        self.apply_overrides(config_data, override_set.get_overrides_for_file(target_file))
+
     def apply_overrides(self, config_data: dict, overrides: List[Override]):
         for override in overrides:
             self.apply_single_override(config_data, override)
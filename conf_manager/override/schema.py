@@ -0,0 +1,191 @@
+import datetime
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Tuple
+import yaml
+from conf_manager.override.processor import Override
+
+# YAML loads unquoted dates and timestamps as date/datetime; they serialize fine as scalars
+SCALAR_TYPES = (str, int, float, bool, datetime.date, datetime.datetime)
+
+# configparser cannot write a key without a value, so null is only allowed for YAML targets
+INI_EXTENSIONS = ('.ini', '.cfg')
+
+VALUE_TYPES = {
+    'str': (str,),
+    'int': (int,),
+    'float': (int, float),
+    'bool': (bool,),
+}
+
+class OverrideValidationError(Exception):
+    def __init__(self, errors: List[str]):
+        self.errors = errors
+        super().__init__(f"{len(errors)} invalid override(s):\n" + "\n".join(errors))
+
+def check_override(override: Override) -> Optional[str]:
+    """Check that a single override's value can be written to its target."""
+    if override.value is None:
+        if os.path.splitext(str(override.target_file))[1].lower() in INI_EXTENSIONS:
+            return "value is empty, INI targets need a value"
+    elif not isinstance(override.value, SCALAR_TYPES):
+        return f"value must be a scalar, got {type(override.value).__name__}"
+    return None
+
+def check_overrides(overrides: Iterable[Override]) -> List[str]:
+    """Check every override in one pass and return every problem found."""
+    errors = []
+    for override in overrides:
+        error = check_override(override)
+        if error:
+            errors.append(f"{override.target_file}: [{override.section}] {override.key}: {error}")
+    return errors
+
+def validate_override_data(override_data: Dict[str, Any], source: str) -> List[str]:
+    """Check the shape of a parsed override file and return every problem found."""
+    overrides = override_data['overrides']
+    if not isinstance(overrides, dict):
+        return [f"{source}: 'overrides' must be a mapping of target files, got {type(overrides).__name__}"]
+
+    errors = []
+    for target_file, sections in overrides.items():
+        if not isinstance(sections, dict):
+            errors.append(f"{source}: {target_file}: expected a mapping of sections, got {type(sections).__name__}")
+            continue
+        for section, keys in sections.items():
+            if not isinstance(keys, dict):
+                errors.append(f"{source}: {target_file}: [{section}]: expected a mapping of keys, "
+                              f"got {type(keys).__name__}")
+                continue
+            for key, value in keys.items():
+                error = check_override(Override(target_file, section, key, value))
+                if error:
+                    errors.append(f"{source}: {target_file}: [{section}] {key}: {error}")
+    return errors
+
+@dataclass
+class KeyRule:
+    value_types: Optional[Tuple[type, ...]] = None
+    pattern: Optional[Pattern] = None
+
+    def check(self, value: Any) -> Optional[str]:
+        if self.value_types is not None:
+            # bool is a subclass of int, but 'int' should not accept true/false
+            if isinstance(value, bool) and bool not in self.value_types:
+                return f"expected {self.type_names()}, got bool"
+            if not isinstance(value, self.value_types):
+                return f"expected {self.type_names()}, got {type(value).__name__}"
+        if self.pattern is not None and not self.pattern.fullmatch(str(value)):
+            return f"value {value!r} does not match pattern {self.pattern.pattern!r}"
+        return None
+
+    def type_names(self) -> str:
+        return "/".join(t.__name__ for t in self.value_types)
+
+@dataclass
+class SectionValidator:
+    keys: Optional[Dict[str, KeyRule]] = None
+
+@dataclass
+class TargetValidator:
+    sections: Optional[Dict[str, SectionValidator]] = None
+
+    def check(self, override: Override) -> Optional[str]:
+        if self.sections is None:
+            return None
+        section = self.sections.get(override.section)
+        if section is None:
+            return f"section [{override.section}] is not allowed"
+        if section.keys is None:
+            return None
+        rule = section.keys.get(override.key)
+        if rule is None:
+            return f"key {override.key} is not allowed in [{override.section}]"
+        return rule.check(override.value)
+
+class OverrideSchema:
+    """Per-target rules for which sections, keys and values overrides may set.
+
+    Schema files are YAML:
+
+        targets:
+          app.ini:
+            sections:
+              Database:
+                keys:
+                  host: {type: str, pattern: '[a-z0-9.-]+'}
+                  port: {type: int}
+
+    Listing `sections` restricts a target to those sections, and listing `keys`
+    restricts a section to those keys. Targets not in the schema are unrestricted.
+    """
+
+    def __init__(self, targets: Dict[str, TargetValidator]):
+        self.targets = targets
+
+    @classmethod
+    def from_file(cls, schema_path: str) -> 'OverrideSchema':
+        stat = os.stat(schema_path)
+        return _compile_schema_file(os.path.abspath(schema_path), stat.st_mtime_ns, stat.st_size)
+
+    @classmethod
+    def compile(cls, schema_data: Dict[str, Any]) -> 'OverrideSchema':
+        if not isinstance(schema_data, dict) or not isinstance(schema_data.get('targets'), dict):
+            raise ValueError("Schema must contain a 'targets' mapping")
+        return cls({target: cls.compile_target(target, spec)
+                    for target, spec in schema_data['targets'].items()})
+
+    @classmethod
+    def compile_target(cls, target: str, spec: Dict[str, Any]) -> TargetValidator:
+        spec = spec or {}
+        if 'sections' not in spec:
+            return TargetValidator()
+        sections = {}
+        for section, section_spec in (spec['sections'] or {}).items():
+            section_spec = section_spec or {}
+            if 'keys' not in section_spec:
+                sections[section] = SectionValidator()
+                continue
+            sections[section] = SectionValidator({
+                key: cls.compile_key(f"{target} [{section}] {key}", key_spec)
+                for key, key_spec in (section_spec['keys'] or {}).items()
+            })
+        return TargetValidator(sections)
+
+    @classmethod
+    def compile_key(cls, name: str, key_spec: Dict[str, Any]) -> KeyRule:
+        key_spec = key_spec or {}
+        rule = KeyRule()
+        if 'type' in key_spec:
+            if key_spec['type'] not in VALUE_TYPES:
+                raise ValueError(f"Unknown value type {key_spec['type']!r} for {name}")
+            rule.value_types = VALUE_TYPES[key_spec['type']]
+        if 'pattern' in key_spec:
+            try:
+                rule.pattern = re.compile(key_spec['pattern'])
+            except re.error as e:
+                raise ValueError(f"Invalid pattern for {name}: {e}")
+        return rule
+
+    def validate(self, overrides: Iterable[Override], config_dir: str) -> List[str]:
+        validators = {os.path.normpath(os.path.join(config_dir, target)): validator
+                      for target, validator in self.targets.items()}
+        errors = []
+        for override in overrides:
+            validator = validators.get(os.path.normpath(override.target_file))
+            if validator is None:
+                continue
+            error = validator.check(override)
+            if error:
+                errors.append(f"{override.target_file}: [{override.section}] {override.key}: {error}")
+        return errors
+
+@lru_cache(maxsize=None)
+def _compile_schema_file(schema_path: str, mtime_ns: int, size: int) -> OverrideSchema:
+    # Keyed on mtime and size so an edited schema is recompiled, an unchanged one never is.
+    # The cache lives for the process only: compiled patterns cannot be persisted, so
+    # each CLI invocation compiles the schema once, while library callers reuse it.
+    with open(schema_path, 'r') as f:
+        return OverrideSchema.compile(yaml.safe_load(f))
@@ -0,0 +1,69 @@
+import marshal
+import os
+import struct
+import zlib
+from typing import List
+from conf_manager.file.file_manager import FileManager
+from conf_manager.override.processor import Override, decode_value, encode_value
+
+SNAPSHOT_FILE_NAME = '.overrides.snapshot'
+
+class SnapshotError(Exception):
+    pass
+
+class OverrideSnapshot:
+    """Binary snapshot of a fully merged set of overrides.
+
+    Layout: a fixed header (magic, format version, sha256 of the source override
+    files, payload length, payload crc32) followed by a marshal-encoded list of
+    override tuples. A snapshot is only used when its source hash matches.
+    """
+
+    MAGIC = b'CMSNAP\0\0'
+    VERSION = 1
+    HEADER = struct.Struct('>8sH32sQI')
+
+    def __init__(self, snapshot_path: str):
+        self.snapshot_path = snapshot_path
+
+    def exists(self) -> bool:
+        return os.path.exists(self.snapshot_path)
+
+    def write(self, overrides: List[Override], source_hash: str):
+        entries = [(o.target_file, o.section, o.key, encode_value(o.value), o.priority) for o in overrides]
+        try:
+            payload = marshal.dumps(entries)
+        except ValueError as e:
+            raise SnapshotError(f"Overrides contain values that cannot be compiled: {e}")
+        header = self.HEADER.pack(self.MAGIC, self.VERSION, bytes.fromhex(source_hash),
+                                  len(payload), zlib.crc32(payload))
+
+        # Replace the snapshot atomically so readers never see a partial file
+        FileManager().write_atomic(self.snapshot_path, header + payload)
+
+    def load(self, source_hash: str) -> List[Override]:
+        try:
+            with open(self.snapshot_path, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            raise SnapshotError(f"Cannot read snapshot {self.snapshot_path}: {e}")
+
+        if len(data) < self.HEADER.size:
+            raise SnapshotError(f"Snapshot {self.snapshot_path} is truncated")
+        magic, version, snapshot_hash, length, checksum = self.HEADER.unpack_from(data)
+        if magic != self.MAGIC:
+            raise SnapshotError(f"{self.snapshot_path} is not an override snapshot")
+        if version != self.VERSION:
+            raise SnapshotError(f"Unsupported snapshot version {version} in {self.snapshot_path}")
+        if snapshot_hash != bytes.fromhex(source_hash):
+            raise SnapshotError(f"Snapshot {self.snapshot_path} is stale")
+
+        payload = memoryview(data)[self.HEADER.size:]
+        if len(payload) != length or zlib.crc32(payload) != checksum:
+            raise SnapshotError(f"Snapshot {self.snapshot_path} is corrupt")
+        try:
+            return [Override(target_file, section, key, decode_value(value), priority)
+                    for target_file, section, key, value, priority in marshal.loads(payload)]
+        except (EOFError, ValueError, TypeError) as e:
+            raise SnapshotError(f"Snapshot {self.snapshot_path} is corrupt: {e}")
+
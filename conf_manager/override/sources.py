@@ -0,0 +1,167 @@
+import hashlib
+import http.client
+import json
+import os
+import posixpath
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+from conf_manager.file.file_manager import FileManager
+from conf_manager.utils.logging_config import get_logger
+
+class OverrideSource(ABC):
+    """Somewhere override files come from; resolves to local paths in apply order."""
+
+    def __init__(self, location: str):
+        self.location = location
+
+    @abstractmethod
+    def get_override_files(self) -> List[str]:
+        pass
+
+class DirectorySource(OverrideSource):
+    def get_override_files(self) -> List[str]:
+        return sorted(
+            [os.path.join(self.location, f) for f in os.listdir(self.location)
+             if f.endswith(('.yaml', '.yml'))]
+        )
+
+class HttpConnectionPool:
+    """Keeps one keep-alive connection per (scheme, host) and reuses it across requests."""
+
+    def __init__(self, timeout: float = 30):
+        self.timeout = timeout
+        self.connections: Dict[Tuple[str, str], http.client.HTTPConnection] = {}
+
+    def get(self, url: str, headers: Dict[str, str]) -> Tuple[http.client.HTTPResponse, bytes]:
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        path = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+        # A pooled connection may have been closed by the server; retry once on a fresh one
+        for attempt in range(2):
+            reused = key in self.connections
+            connection = self.get_connection(key)
+            try:
+                connection.request('GET', path, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, ConnectionError):
+                self.discard(key)
+                if reused and attempt == 0:
+                    continue
+                raise
+            if response.will_close:
+                self.discard(key)
+            return response, body
+
+    def get_connection(self, key: Tuple[str, str]) -> http.client.HTTPConnection:
+        if key not in self.connections:
+            scheme, netloc = key
+            if scheme == 'https':
+                self.connections[key] = http.client.HTTPSConnection(netloc, timeout=self.timeout)
+            elif scheme == 'http':
+                self.connections[key] = http.client.HTTPConnection(netloc, timeout=self.timeout)
+            else:
+                raise ValueError(f"Unsupported URL scheme: {scheme}")
+        return self.connections[key]
+
+    def discard(self, key: Tuple[str, str]):
+        connection = self.connections.pop(key, None)
+        if connection:
+            connection.close()
+
+    def close(self):
+        for key in list(self.connections):
+            self.discard(key)
+
+class HttpSource(OverrideSource):
+    """A single override document fetched over HTTP(S) into a local cache.
+
+    The ETag and Last-Modified of the cached copy are sent back as conditional
+    request headers, so an unchanged document costs a 304 and keeps the exact
+    same bytes on disk (and therefore the same content hash for the layer
+    cache and snapshots).
+    """
+
+    def __init__(self, location: str, cache_dir: str, pool: Optional[HttpConnectionPool] = None):
+        super().__init__(location)
+        url_hash = hashlib.sha256(location.encode()).hexdigest()[:16]
+        self.cache_dir = os.path.join(cache_dir, 'http', url_hash)
+        self.pool = pool or HttpConnectionPool()
+        self.file_manager = FileManager()
+        self.logger = get_logger(__name__)
+        self._files: Optional[List[str]] = None
+
+    @property
+    def cached_file(self) -> str:
+        file_name = posixpath.basename(urlsplit(self.location).path) or 'overrides'
+        if not file_name.endswith(('.yaml', '.yml')):
+            file_name += '.yaml'
+        return os.path.join(self.cache_dir, file_name)
+
+    @property
+    def metadata_file(self) -> str:
+        return os.path.join(self.cache_dir, 'metadata.json')
+
+    def get_override_files(self) -> List[str]:
+        # Fetch at most once per run, however many times the layer is listed
+        if self._files is None:
+            self._files = [self.fetch()]
+        return self._files
+
+    def fetch(self) -> str:
+        metadata = self.load_metadata()
+        headers = {}
+        if metadata.get('etag'):
+            headers['If-None-Match'] = metadata['etag']
+        if metadata.get('last_modified'):
+            headers['If-Modified-Since'] = metadata['last_modified']
+
+        try:
+            response, body = self.pool.get(self.location, headers)
+        except (OSError, http.client.HTTPException) as e:
+            return self.use_cached_copy(f"request failed: {e}")
+
+        if response.status == 304 and os.path.exists(self.cached_file):
+            self.logger.debug(f"Overrides not modified: {self.location}")
+            return self.cached_file
+        if response.status != 200:
+            return self.use_cached_copy(f"server returned {response.status} {response.reason}")
+
+        self.store(body, {
+            'etag': response.getheader('ETag'),
+            'last_modified': response.getheader('Last-Modified'),
+        })
+        self.logger.info(f"Fetched overrides from {self.location}")
+        return self.cached_file
+
+    def use_cached_copy(self, reason: str) -> str:
+        if not os.path.exists(self.cached_file):
+            raise OSError(f"Cannot fetch overrides from {self.location} ({reason}) and no cached copy exists")
+        self.logger.warning(f"Using cached overrides for {self.location}: {reason}")
+        return self.cached_file
+
+    def load_metadata(self) -> Dict[str, Optional[str]]:
+        if not os.path.exists(self.cached_file):
+            return {}
+        try:
+            with open(self.metadata_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def store(self, body: bytes, metadata: Dict[str, Optional[str]]):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.file_manager.write_atomic(self.cached_file, body)
+        self.file_manager.write_atomic(self.metadata_file, json.dumps(metadata).encode())
+
+def is_url(location: str) -> bool:
+    return location.startswith(('http://', 'https://'))
+
+def make_source(location: str, cache_dir: Optional[str] = None,
+                pool: Optional[HttpConnectionPool] = None) -> OverrideSource:
+    if is_url(location):
+        if not cache_dir:
+            raise ValueError(f"A cache directory is required to fetch overrides from {location}")
+        return HttpSource(location, cache_dir, pool)
+    return DirectorySource(location)
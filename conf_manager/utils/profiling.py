@@ -0,0 +1,76 @@
+import cProfile
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterable, List, Optional, Tuple
+from conf_manager.utils.logging_config import get_logger
+
+PHASES = ('load', 'apply', 'convert')
+
+class Profiler:
+    """Optional cProfile / tracemalloc instrumentation around named phases.
+
+    With no phases selected every phase is profiled; otherwise only the selected
+    ones are. Phases do not nest: once one is being profiled, inner phases are
+    already covered by it.
+    """
+
+    def __init__(self, cpu_file: Optional[str] = None, mem_file: Optional[str] = None,
+                 phases: Optional[Iterable[str]] = None, top: int = 25):
+        self.cpu_file = cpu_file
+        self.mem_file = mem_file
+        self.phases = set(phases) if phases else None
+        self.top = top
+        self.cpu_profile = cProfile.Profile() if cpu_file else None
+        self.mem_snapshots: List[Tuple[str, tracemalloc.Snapshot, int]] = []
+        self.active_phase: Optional[str] = None
+        self.logger = get_logger(__name__)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.cpu_file or self.mem_file)
+
+    def is_selected(self, name: str) -> bool:
+        return self.phases is None or name in self.phases
+
+    @contextmanager
+    def phase(self, name: str):
+        if not self.enabled or self.active_phase is not None or not self.is_selected(name):
+            yield
+            return
+
+        self.active_phase = name
+        if self.mem_file:
+            tracemalloc.start()
+        if self.cpu_profile:
+            self.cpu_profile.enable()
+        try:
+            yield
+        finally:
+            if self.cpu_profile:
+                self.cpu_profile.disable()
+            if self.mem_file:
+                _, peak = tracemalloc.get_traced_memory()
+                self.mem_snapshots.append((name, tracemalloc.take_snapshot(), peak))
+                tracemalloc.stop()
+            self.active_phase = None
+
+    def write(self):
+        if self.cpu_file:
+            self.cpu_profile.dump_stats(self.cpu_file)
+            self.logger.info(f"CPU profile written to {self.cpu_file}")
+        if self.mem_file:
+            self.write_memory_report()
+            self.logger.info(f"Memory profile written to {self.mem_file}")
+
+    def write_memory_report(self):
+        with open(self.mem_file, 'w') as f:
+            for name, snapshot, peak in self.mem_snapshots:
+                stats = snapshot.statistics('lineno')
+                total = sum(stat.size for stat in stats)
+                f.write(f"Phase: {name}\n")
+                f.write(f"Peak traced memory: {peak / 1024:.1f} KiB\n")
+                f.write(f"Live at end of phase: {total / 1024:.1f} KiB\n")
+                f.write(f"Top {self.top} allocations:\n")
+                for stat in stats[:self.top]:
+                    f.write(f"  {stat}\n")
+                f.write("\n")
@@ -96,4 +96,65 @@ def test_convert_nonexistent_file(tmp_path):
 
     # Try to convert a non-existent file
     with pytest.raises(FileNotFoundError):
-        converter.convert_to_override(str(tmp_path / "nonexistent.conf"), str(override_dir))
\ No newline at end of file
+        converter.convert_to_override(str(tmp_path / "nonexistent.conf"), str(override_dir))
+def test_diff_to_override(tmp_path):
+    # Create a baseline and a modified config file
+    baseline_file = tmp_path / "baseline" / "app.ini"
+    baseline_file.parent.mkdir()
+    baseline_file.write_text("""
+    top = 1
+    [Unchanged]
+    key1 = value1
+    [Changed]
+    key2 = value2
+    key3 = value3
+    """)
+    config_file = tmp_path / "app.ini"
+    config_file.write_text("""
+    top = 1
+    [Unchanged]
+    key1 = value1
+    [Changed]
+    key2 = value2
+    key3 = custom3
+    key4 = value4
+    [Added]
+    key5 = value5
+    """)
+
+    override_dir = tmp_path / "override.d"
+    override_dir.mkdir()
+
+    converter = ConfigConverter()
+    yaml_file_path = converter.diff_to_override(str(baseline_file), str(config_file), str(override_dir))
+
+    # Only the differing keys end up in the override
+    assert yaml_file_path == str(override_dir / "app.yml")
+    with open(yaml_file_path, 'r') as f:
+        data = yaml.safe_load(f)
+        assert data == {
+            "Changed": {"key3": "custom3", "key4": "value4"},
+            "Added": {"key5": "value5"}
+        }
+
+def test_diff_identical_files(tmp_path):
+    config_file = tmp_path / "app.ini"
+    config_file.write_text("[Section1]\nkey1 = value1\n")
+
+    override_dir = tmp_path / "override.d"
+    override_dir.mkdir()
+
+    converter = ConfigConverter()
+    yaml_file_path = converter.diff_to_override(str(config_file), str(config_file), str(override_dir))
+
+    with open(yaml_file_path, 'r') as f:
+        assert yaml.safe_load(f) == {}
+
+def test_parse_config_file_with_crlf_and_utf8(tmp_path):
+    config_file = tmp_path / "app.conf"
+    config_file.write_bytes("[Café]\r\n# comment\r\nname = Zoë\r\n\r\nurl = a=b\r\n".encode())
+    assert ConfigConverter().parse_config_file(str(config_file)) == {'Café': {'name': 'Zoë', 'url': 'a=b'}}
+
+    empty_file = tmp_path / "empty.conf"
+    empty_file.write_bytes(b"")
+    assert ConfigConverter().parse_config_file(str(empty_file)) == {}
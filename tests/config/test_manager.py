@@ -153,3 +153,306 @@ def test_dry_run(config_manager, tmp_path, caplog):
     assert any("Starting configuration management process" in record.message for record in caplog.records)
     assert any("Configuration management process completed" in record.message for record in caplog.records)
     assert any("Would apply overrides to" in record.message for record in caplog.records)
+
+def write_layer(path, content):
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "override.yaml").write_text(content)
+
+def test_layered_overrides(tmp_path):
+    config_file = tmp_path / "config" / "config.ini"
+    config_file.parent.mkdir()
+    config_file.write_text("[Section1]\nkey1 = original1\nkey2 = original2\n")
+
+    write_layer(tmp_path / "base", """
+    overrides:
+      config.ini:
+        Section1:
+          key1: base1
+          key2: base2
+    """)
+    write_layer(tmp_path / "host", """
+    overrides:
+      config.ini:
+        Section1:
+          key2: host2
+    """)
+
+    config_manager = ConfigManager(str(tmp_path / "base"), str(tmp_path / "config"),
+                                   layer_dirs=[str(tmp_path / "host")])
+    assert config_manager.run(dry_run=False) == 0
+
+    content = config_file.read_text()
+    assert "key1 = base1" in content
+    assert "key2 = host2" in content
+
+def test_layer_cache_skips_parsing_base_layers(tmp_path, monkeypatch, caplog):
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    write_layer(tmp_path / "base", """
+    overrides:
+      config.ini:
+        Section1:
+          key1: base1
+    """)
+    write_layer(tmp_path / "env", """
+    overrides:
+      config.ini:
+        Section1:
+          key2: env2
+    """)
+    write_layer(tmp_path / "host", """
+    overrides:
+      config.ini:
+        Section1:
+          key1: host1
+    """)
+    layer_dirs = [str(tmp_path / "env"), str(tmp_path / "host")]
+    cache_dir = str(tmp_path / "cache")
+
+    first = ConfigManager(str(tmp_path / "base"), str(config_dir), layer_dirs=layer_dirs, cache_dir=cache_dir)
+    first.load_all_overrides()
+
+    parsed_files = []
+    second = ConfigManager(str(tmp_path / "base"), str(config_dir), layer_dirs=layer_dirs, cache_dir=cache_dir)
+    original_load = second.load_yaml_file
+    monkeypatch.setattr(second, "load_yaml_file", lambda path: parsed_files.append(path) or original_load(path))
+    second.load_all_overrides()
+
+    assert parsed_files == [str(tmp_path / "host" / "override.yaml")]
+    assert any("from cache" in record.message for record in caplog.records)
+    overrides = second.override_set.get_overrides_for_file(str(config_dir / "config.ini"))
+    assert [(o.key, o.value, o.priority) for o in overrides] == [
+        ("key1", "base1", 0), ("key2", "env2", 1), ("key1", "host1", 2)
+    ]
+
+def test_edited_base_layer_replaces_its_cache_file(tmp_path):
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    write_layer(tmp_path / "host", "overrides: {}\n")
+    cache_dir = tmp_path / "cache"
+
+    for value in ("base1", "base2", "base3"):
+        write_layer(tmp_path / "base", f"overrides:\n  config.ini:\n    Section1:\n      key1: {value}\n")
+        config_manager = ConfigManager(str(tmp_path / "base"), str(config_dir),
+                                       layer_dirs=[str(tmp_path / "host")], cache_dir=str(cache_dir))
+        config_manager.load_all_overrides()
+        overrides = config_manager.override_set.get_overrides_for_file(str(config_dir / "config.ini"))
+        assert [o.value for o in overrides] == [value]
+
+    assert len(list(cache_dir.glob("layers-*.json"))) == 1
+
+def test_run_with_async_engine(tmp_path):
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    (config_dir / "a.ini").write_text("[Section1]\nkey1 = original1\n")
+    (config_dir / "b.yaml").write_text("Section1:\n  key1: original1\n")
+    write_layer(tmp_path / "override.d", """
+    overrides:
+      a.ini:
+        Section1:
+          key1: new_a
+      b.yaml:
+        Section1:
+          key1: new_b
+    """)
+
+    config_manager = ConfigManager(str(tmp_path / "override.d"), str(config_dir), engine='async', concurrency=2)
+    assert config_manager.run(dry_run=False) == 0
+
+    assert "key1 = new_a" in (config_dir / "a.ini").read_text()
+    assert "key1: new_b" in (config_dir / "b.yaml").read_text()
+
+def test_compiled_snapshot_is_used_until_stale(tmp_path, monkeypatch, caplog):
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    override_dir = tmp_path / "override.d"
+    write_layer(override_dir, """
+    overrides:
+      config.ini:
+        Section1:
+          key1: value1
+    """)
+
+    snapshot_file = ConfigManager(str(override_dir), str(config_dir)).compile_snapshot()
+    assert snapshot_file == str(override_dir / ".overrides.snapshot")
+
+    config_manager = ConfigManager(str(override_dir), str(config_dir))
+    monkeypatch.setattr(config_manager, "load_yaml_file", lambda path: pytest.fail("YAML was parsed"))
+    config_manager.load_all_overrides()
+    overrides = config_manager.override_set.get_overrides_for_file(str(config_dir / "config.ini"))
+    assert [(o.key, o.value) for o in overrides] == [("key1", "value1")]
+
+    # Changing an override file invalidates the snapshot
+    write_layer(override_dir, """
+    overrides:
+      config.ini:
+        Section1:
+          key1: value2
+    """)
+    config_manager = ConfigManager(str(override_dir), str(config_dir))
+    config_manager.load_all_overrides()
+    overrides = config_manager.override_set.get_overrides_for_file(str(config_dir / "config.ini"))
+    assert [(o.key, o.value) for o in overrides] == [("key1", "value2")]
+    assert any("stale" in record.message for record in caplog.records)
+
+def test_invalid_overrides_abort_before_apply(tmp_path, caplog):
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    config_file = config_dir / "config.ini"
+    config_file.write_text("[Section1]\nkey1 = original1\n")
+    schema_file = tmp_path / "schema.yaml"
+    schema_file.write_text("""
+    targets:
+      config.ini:
+        sections:
+          Section1:
+            keys:
+              key1: {type: int}
+    """)
+    override_dir = tmp_path / "override.d"
+    override_dir.mkdir()
+    (override_dir / "01-override.yaml").write_text("""
+    overrides:
+      config.ini:
+        Section1:
+          key1: not_a_number
+    """)
+    (override_dir / "02-override.yaml").write_text("""
+    overrides:
+      config.ini:
+        Section1: [not, a, mapping]
+    """)
+
+    config_manager = ConfigManager(str(override_dir), str(config_dir), schema_path=str(schema_file))
+    assert config_manager.run(dry_run=False) == 1
+
+    assert "key1 = original1" in config_file.read_text()
+    invalid = [record.message for record in caplog.records if record.message.startswith("Invalid override")]
+    assert len(invalid) == 2
+
+def test_http_override_layer(tmp_path):
+    import threading
+    from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+    from functools import partial
+
+    served_dir = tmp_path / "served"
+    write_layer(served_dir, """
+    overrides:
+      config.ini:
+        Section1:
+          key1: from_http
+    """)
+    handler = partial(SimpleHTTPRequestHandler, directory=str(served_dir))
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    try:
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        config_file = config_dir / "config.ini"
+        config_file.write_text("[Section1]\nkey1 = original1\n")
+        (tmp_path / "base").mkdir()
+
+        url = f"http://127.0.0.1:{server.server_address[1]}/override.yaml"
+        config_manager = ConfigManager(str(tmp_path / "base"), str(config_dir), layer_dirs=[url],
+                                       cache_dir=str(tmp_path / "cache"))
+        assert config_manager.run(dry_run=False) == 0
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert "key1 = from_http" in config_file.read_text()
+
+def test_run_with_process_engine(tmp_path):
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    (config_dir / "a.ini").write_text("[Section1]\nkey1 = original1\n")
+    (config_dir / "b.yaml").write_text("Section1:\n  key1: original1\n")
+    write_layer(tmp_path / "override.d", """
+    overrides:
+      a.ini:
+        Section1:
+          key1: new_a
+      b.yaml:
+        Section1:
+          key1: new_b
+    """)
+
+    config_manager = ConfigManager(str(tmp_path / "override.d"), str(config_dir), engine='process', concurrency=2)
+    assert config_manager.run(dry_run=False) == 0
+
+    assert "key1 = new_a" in (config_dir / "a.ini").read_text()
+    assert "key1: new_b" in (config_dir / "b.yaml").read_text()
+
+def test_layer_cache_not_stored_when_base_layer_fails_to_load(tmp_path, caplog):
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    write_layer(tmp_path / "base", """
+    overrides:
+      config.ini:
+        Section1:
+          key1: base1
+    """)
+    (tmp_path / "base" / "02-broken.yaml").write_text("overrides: [unclosed\n")
+    write_layer(tmp_path / "host", """
+    overrides:
+      config.ini:
+        Section1:
+          key2: host2
+    """)
+    cache_dir = tmp_path / "cache"
+
+    for _ in range(2):
+        caplog.clear()
+        config_manager = ConfigManager(str(tmp_path / "base"), str(config_dir),
+                                       layer_dirs=[str(tmp_path / "host")], cache_dir=str(cache_dir))
+        config_manager.load_all_overrides()
+        assert any("Error parsing YAML file" in record.message for record in caplog.records)
+        assert not any("from cache" in record.message for record in caplog.records)
+
+    assert not cache_dir.exists() or not list(cache_dir.glob("layers-*.json"))
+
+def test_compile_fails_when_override_file_fails_to_parse(tmp_path):
+    from conf_manager.override.snapshot import SnapshotError
+
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    override_dir = tmp_path / "override.d"
+    write_layer(override_dir, """
+    overrides:
+      config.ini:
+        Section1:
+          key1: value1
+    """)
+    (override_dir / "02-broken.yaml").write_text("overrides: [unclosed\n")
+
+    with pytest.raises(SnapshotError, match="02-broken.yaml"):
+        ConfigManager(str(override_dir), str(config_dir)).compile_snapshot()
+    assert not (override_dir / ".overrides.snapshot").exists()
+
+def test_unquoted_date_override_is_applied(config_manager, tmp_path):
+    config_file = tmp_path / "config" / "config.ini"
+    config_file.write_text("[Section1]\nreleased = never\n")
+    (tmp_path / "override.d" / "override.yaml").write_text("""
+    overrides:
+      config.ini:
+        Section1:
+          released: 2024-01-01
+    """)
+
+    assert config_manager.run(dry_run=False) == 0
+    assert "released = 2024-01-01" in config_file.read_text()
+
+def test_empty_ini_value_rejected_at_load(config_manager, tmp_path, caplog):
+    config_file = tmp_path / "config" / "app.ini"
+    config_file.write_text("[Section1]\nk = original\n")
+    (tmp_path / "override.d" / "override.yaml").write_text("""
+    overrides:
+      app.ini:
+        Section1:
+          k:
+    """)
+
+    assert config_manager.run(dry_run=False) == 1
+    assert "k = original" in config_file.read_text()
+    assert any("INI targets need a value" in record.message for record in caplog.records)
+    assert not any("Error applying overrides" in record.message for record in caplog.records)
@@ -0,0 +1,41 @@
+import fcntl
+import threading
+import pytest
+from conf_manager.file.file_lock import FileLock, FileLockTimeout
+
+@pytest.fixture
+def target_file(tmp_path):
+    target = tmp_path / "config.ini"
+    target.write_text("[Section1]\nkey1 = value1\n")
+    return str(target)
+
+def test_lock_and_release(target_file):
+    lock = FileLock(target_file)
+    with lock:
+        assert lock.is_locked
+    assert not lock.is_locked
+
+def test_lock_timeout_when_held(target_file):
+    with FileLock(target_file):
+        with pytest.raises(FileLockTimeout):
+            FileLock(target_file, timeout=0.1, poll_interval=0.01).acquire()
+
+def test_lock_waits_for_release(target_file):
+    holder = FileLock(target_file)
+    holder.acquire()
+    timer = threading.Timer(0.1, holder.release)
+    timer.start()
+    try:
+        waiter = FileLock(target_file, timeout=5, poll_interval=0.01)
+        with waiter:
+            assert waiter.wait_time >= 0.05
+    finally:
+        timer.join()
+
+def test_lock_survives_rewrite(target_file):
+    with FileLock(target_file):
+        with open(target_file, 'w') as f:
+            f.write("[Section1]\nkey1 = value2\n")
+        with open(target_file, 'r') as f:
+            with pytest.raises(BlockingIOError):
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
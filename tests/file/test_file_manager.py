@@ -18,3 +18,55 @@ def test_write_to_readonly_file(tmp_path, file_manager):
 
     with pytest.raises(PermissionError):
         file_manager.write_file(str(readonly_file), "New content")
+
+@pytest.fixture(params=[False, True], ids=["in-memory", "streamed"])
+def streamed(request, monkeypatch):
+    # Force the mmap/chunked path with tiny thresholds so it is exercised by small files
+    if request.param:
+        monkeypatch.setattr("conf_manager.file.file_manager.STREAM_THRESHOLD", 0)
+        monkeypatch.setattr("conf_manager.file.file_manager.CHUNK_SIZE", 7)
+    return request.param
+
+def test_hash_file(tmp_path, file_manager, streamed):
+    import hashlib
+    test_file = tmp_path / "test.bin"
+    content = b"line one\nline two\n" * 10
+    test_file.write_bytes(content)
+
+    assert file_manager.hash_file(str(test_file)) == hashlib.sha256(content).hexdigest()
+    assert file_manager.hash_file(str(test_file), 'md5') == hashlib.md5(content).hexdigest()
+
+def test_files_equal(tmp_path, file_manager, streamed):
+    first = tmp_path / "first.ini"
+    second = tmp_path / "second.ini"
+    first.write_bytes(b"[Section1]\nkey1 = value1\n" * 5)
+    second.write_bytes(b"[Section1]\nkey1 = value1\n" * 5)
+
+    assert file_manager.files_equal(str(first), str(second))
+    second.write_bytes(b"[Section1]\nkey1 = value2\n" * 5)
+    assert not file_manager.files_equal(str(first), str(second))
+    second.write_bytes(b"[Section1]\n")
+    assert not file_manager.files_equal(str(first), str(second))
+
+def test_iter_lines_and_empty_files(tmp_path, file_manager):
+    test_file = tmp_path / "test.ini"
+    test_file.write_bytes(b"first\nsecond\nthird")
+    assert list(file_manager.iter_lines(str(test_file))) == [b"first\n", b"second\n", b"third"]
+
+    empty_file = tmp_path / "empty.ini"
+    empty_file.write_bytes(b"")
+    assert list(file_manager.iter_lines(str(empty_file))) == []
+    assert file_manager.read_bytes(str(empty_file)) == b""
+    with file_manager.map_file(str(empty_file)) as data:
+        assert len(data) == 0
+
+def test_read_bytes_nonexistent_file(tmp_path, file_manager):
+    with pytest.raises(FileNotFoundError):
+        file_manager.read_bytes(str(tmp_path / "missing.txt"))
+
+def test_write_atomic(tmp_path, file_manager):
+    test_file = tmp_path / "snapshot.bin"
+    test_file.write_bytes(b"old")
+    file_manager.write_atomic(str(test_file), b"new\0data")
+    assert test_file.read_bytes() == b"new\0data"
+    assert [path.name for path in tmp_path.iterdir()] == ["snapshot.bin"]
@@ -0,0 +1,24 @@
+import pytest
+from conf_manager.config.parser import ConfigParser
+from conf_manager.override.processor import Override, OverrideSet
+
+@pytest.fixture
+def config_parser():
+    return ConfigParser()
+
+@pytest.fixture
+def make_targets(tmp_path, config_parser):
+    """Factory for `count` target files, each with one override; target i is i filler keys larger."""
+    def make(count, extension='.ini'):
+        override_set = OverrideSet()
+        targets = []
+        for i in range(count):
+            config_file = str(tmp_path / f"config{i}{extension}")
+            config_parser.serialize({
+                'Section1': {'key1': 'value1'},
+                'Filler': {f'k{j}': 'v' for j in range(i)},
+            }, config_file)
+            override_set.add_override(Override(config_file, "Section1", "key1", f"new_value{i}"))
+            targets.append(config_file)
+        return override_set, targets
+    return make
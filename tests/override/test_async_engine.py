@@ -0,0 +1,58 @@
+import logging
+import time
+import pytest
+from conf_manager.config.parser import ConfigParser
+from conf_manager.override.async_engine import AsyncOverrideEngine
+from conf_manager.override.processor import OverrideProcessor, Override
+
+DELAY = 0.05
+
+class DelayedConfigParser(ConfigParser):
+    """Simulates a high-latency filesystem by delaying every read and write."""
+
+    def parse(self, file_path):
+        time.sleep(DELAY)
+        return super().parse(file_path)
+
+    def serialize(self, config_data, file_path):
+        time.sleep(DELAY)
+        super().serialize(config_data, file_path)
+
+def test_apply_overrides(tmp_path, config_parser, make_targets):
+    override_set, targets = make_targets(5)
+
+    engine = AsyncOverrideEngine(OverrideProcessor(config_parser), concurrency=2)
+    engine.run(override_set, targets)
+
+    for i, target in enumerate(targets):
+        assert config_parser.parse(target)['Section1'] == {'key1': f'new_value{i}'}
+
+def test_overlaps_slow_io(tmp_path, config_parser, make_targets):
+    count = 10
+    override_set, targets = make_targets(count)
+
+    engine = AsyncOverrideEngine(OverrideProcessor(DelayedConfigParser()), concurrency=count)
+    start = time.monotonic()
+    engine.run(override_set, targets)
+    elapsed = time.monotonic() - start
+
+    # Sequential processing would take at least count * 2 * DELAY
+    assert elapsed < count * 2 * DELAY / 2
+    assert config_parser.parse(targets[-1])['Section1'] == {'key1': f'new_value{count - 1}'}
+
+def test_dry_run_and_missing_targets(tmp_path, config_parser, caplog, make_targets):
+    caplog.set_level(logging.INFO)
+    override_set, targets = make_targets(1)
+    missing = str(tmp_path / "missing.ini")
+    override_set.add_override(Override(missing, "Section1", "key1", "value"))
+
+    engine = AsyncOverrideEngine(OverrideProcessor(config_parser))
+    engine.run(override_set, targets + [missing], dry_run=True)
+
+    assert config_parser.parse(targets[0])['Section1'] == {'key1': 'value1'}
+    assert any("Would apply overrides to" in record.message for record in caplog.records)
+    assert any("Target file does not exist" in record.message for record in caplog.records)
+
+def test_invalid_concurrency(config_parser):
+    with pytest.raises(ValueError):
+        AsyncOverrideEngine(OverrideProcessor(config_parser), concurrency=0)
@@ -0,0 +1,50 @@
+from conf_manager.override.cache import LayerCache, hash_layer_locations, hash_override_files
+from conf_manager.override.processor import Override
+
+def test_hash_changes_with_content(tmp_path):
+    override_file = tmp_path / "01.yaml"
+    override_file.write_text("overrides: {}\n")
+    first = hash_override_files([[str(override_file)]], "/etc/app")
+
+    assert hash_override_files([[str(override_file)]], "/etc/app") == first
+    assert hash_override_files([[str(override_file)]], "/etc/other") != first
+
+    override_file.write_text("overrides: {a: {}}\n")
+    assert hash_override_files([[str(override_file)]], "/etc/app") != first
+
+def test_cache_round_trip(tmp_path):
+    cache = LayerCache(str(tmp_path / "cache"))
+    overrides = [
+        Override("/etc/app/config.ini", "Section1", "key1", "value1", 0),
+        Override("/etc/app/config.ini", "Section1", "port", 5432, 1),
+    ]
+
+    assert cache.load("abc", "v1") is None
+    cache.store("abc", "v1", overrides)
+    assert cache.load("abc", "v1") == overrides
+    assert cache.load("abc", "v2") is None
+
+    cache.store("abc", "v2", overrides[:1])
+    assert cache.load("abc", "v2") == overrides[:1]
+    assert [path.name for path in (tmp_path / "cache").iterdir()] == ["layers-abc.json"]
+
+def test_layer_locations_key(tmp_path):
+    key = hash_layer_locations(["/srv/base", "/srv/env"], "/etc/app")
+    assert hash_layer_locations(["/srv/base", "/srv/env"], "/etc/app") == key
+    assert hash_layer_locations(["/srv/env", "/srv/base"], "/etc/app") != key
+    assert hash_layer_locations(["/srv/base", "/srv/env"], "/etc/other") != key
+
+def test_corrupt_cache_is_ignored(tmp_path):
+    cache = LayerCache(str(tmp_path))
+    (tmp_path / "layers-abc.json").write_text("{not json")
+    assert cache.load("abc", "v1") is None
+
+def test_cache_round_trips_dates(tmp_path):
+    import datetime
+    cache = LayerCache(str(tmp_path))
+    overrides = [
+        Override("/etc/app/config.ini", "Release", "date", datetime.date(2024, 1, 1), 0),
+        Override("/etc/app/config.ini", "Release", "at", datetime.datetime(2024, 1, 1, 10, 0), 0),
+    ]
+    cache.store("abc", "v1", overrides)
+    assert cache.load("abc", "v1") == overrides
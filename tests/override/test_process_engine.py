@@ -0,0 +1,55 @@
+import logging
+from conf_manager.override.process_engine import ProcessOverrideEngine, apply_shard
+from conf_manager.override.processor import Override, TargetResult
+
+def test_apply_overrides(tmp_path, config_parser, caplog, make_targets):
+    caplog.set_level(logging.INFO)
+    override_set, targets = make_targets(6, '.yaml')
+    missing = str(tmp_path / "missing.yaml")
+    override_set.add_override(Override(missing, "Section1", "key1", "value"))
+
+    engine = ProcessOverrideEngine(workers=2)
+    results = engine.run(override_set, targets + [missing])
+
+    assert [result.target_file for result in results] == sorted(targets + [missing])
+    statuses = {result.target_file: result.status for result in results}
+    assert statuses[missing] == TargetResult.MISSING
+    for i, target in enumerate(targets):
+        assert statuses[target] == TargetResult.APPLIED
+        assert config_parser.parse(target)['Section1'] == {'key1': f'new_value{i}'}
+    assert any("Applied overrides to" in record.message for record in caplog.records)
+    assert any("Target file does not exist" in record.message for record in caplog.records)
+
+def test_shards_are_balanced_and_disjoint(tmp_path, make_targets):
+    override_set, targets = make_targets(20, '.yaml')
+
+    engine = ProcessOverrideEngine(workers=2, shards_per_worker=2)
+    shards = engine.shard_targets(override_set, targets)
+
+    assert len(shards) == 4
+    sharded_targets = [target for shard in shards for target, _ in shard]
+    assert sorted(sharded_targets) == sorted(targets)
+    for shard in shards:
+        for target, overrides in shard:
+            assert all(override.target_file == target for override in overrides)
+    loads = [sum(engine.estimate_cost(target, overrides) for target, overrides in shard) for shard in shards]
+    assert max(loads) - min(loads) <= max(engine.estimate_cost(t, o) for shard in shards for t, o in shard)
+
+def test_apply_shard_reports_failures(tmp_path):
+    bad_file = tmp_path / "bad.txt"
+    bad_file.write_text("")
+    results = apply_shard([(str(bad_file), [Override(str(bad_file), "Section1", "key1", "value")])],
+                          dry_run=False, lock_timeout=None)
+    assert results[0].failed
+    assert "Unsupported file format" in results[0].error
+
+def test_dry_run(tmp_path, config_parser, monkeypatch, make_targets):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("dry run must not start worker processes")
+    monkeypatch.setattr("conf_manager.override.process_engine.ProcessPoolExecutor", no_pool)
+
+    override_set, targets = make_targets(2, '.yaml')
+    results = ProcessOverrideEngine(workers=2).run(override_set, targets, dry_run=True)
+
+    assert [result.status for result in results] == [TargetResult.WOULD_APPLY] * 2
+    assert config_parser.parse(targets[0])['Section1'] == {'key1': 'value1'}
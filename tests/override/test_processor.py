@@ -1,11 +1,6 @@
 import pytest
 import os
 from conf_manager.override.processor import OverrideProcessor, Override, OverrideSet
-from conf_manager.config.parser import ConfigParser
-
-@pytest.fixture
-def config_parser():
-    return ConfigParser()
 
 @pytest.fixture
 def override_processor(config_parser):
@@ -126,4 +121,31 @@ def test_apply_override_to_nonexistent_file(tmp_path, override_processor):
     override_set.add_override(override)
 
     with pytest.raises(FileNotFoundError):
-        override_processor.process(override_set, str(nonexistent_file))
\ No newline at end of file
+        override_processor.process(override_set, str(nonexistent_file))
+
+def test_process_times_out_on_locked_target(tmp_path, config_parser):
+    from conf_manager.file.file_lock import FileLock, FileLockTimeout
+
+    config_file = tmp_path / "config.ini"
+    config_file.write_text("[Section1]\nkey1 = value1\n")
+    override_set = OverrideSet()
+    override_set.add_override(Override(target_file=str(config_file), section="Section1", key="key1", value="new_value1"))
+
+    processor = OverrideProcessor(config_parser, lock_timeout=0.1)
+    with FileLock(str(config_file)):
+        with pytest.raises(FileLockTimeout):
+            processor.process(override_set, str(config_file))
+
+    assert config_parser.parse(str(config_file)) == {'Section1': {'key1': 'value1'}}
+
+def test_add_overrides_in_bulk(tmp_path):
+    config_file = str(tmp_path / "config.ini")
+    override_set = OverrideSet()
+    count = override_set.add_overrides([
+        Override(target_file=config_file, section="Section1", key="key1", value="value1"),
+        Override(target_file=str(tmp_path / "." / "config.ini"), section="Section1", key="key2", value="value2"),
+    ])
+
+    assert count == 2
+    assert override_set.count_overrides_for_file(config_file) == 2
+    assert [o.key for o in override_set.get_overrides_for_file(config_file)] == ["key1", "key2"]
@@ -0,0 +1,86 @@
+import pytest
+import yaml
+from conf_manager.override.processor import Override
+from conf_manager.override.schema import OverrideSchema, validate_override_data
+
+SCHEMA = """
+targets:
+  app.ini:
+    sections:
+      Database:
+        keys:
+          host: {type: str, pattern: '[a-z0-9.-]+'}
+          port: {type: int}
+      Free:
+"""
+
+@pytest.fixture
+def schema_file(tmp_path):
+    schema_file = tmp_path / "schema.yaml"
+    schema_file.write_text(SCHEMA)
+    return schema_file
+
+def test_validate_override_data_reports_all_errors():
+    override_data = {'overrides': {
+        'a.ini': ['not', 'a', 'mapping'],
+        'b.ini': {'Section1': 'value'},
+        'c.ini': {'Section1': {'key1': ['list'], 'key2': 'ok', 'key3': {'nested': 1}}},
+    }}
+
+    errors = validate_override_data(override_data, 'override.yaml')
+
+    assert len(errors) == 4
+    assert all(error.startswith('override.yaml: ') for error in errors)
+
+def test_validate_override_data_accepts_scalars():
+    override_data = yaml.safe_load("""
+    overrides:
+      a.ini:
+        Section1: {s: x, i: 1, f: 1.5, b: true, released: 2024-01-01, at: 2024-01-01 10:00:00}
+      b.yaml:
+        Section1: {n: }
+    """)
+    assert validate_override_data(override_data, 'override.yaml') == []
+
+def test_validate_override_data_rejects_null_for_ini_targets():
+    override_data = {'overrides': {'a.ini': {'Section1': {'k': None}}, 'b.cfg': {'Section1': {'k': None}}}}
+
+    errors = validate_override_data(override_data, 'override.yaml')
+
+    assert len(errors) == 2
+    assert all("INI targets need a value" in error for error in errors)
+
+def test_schema_validation(schema_file):
+    schema = OverrideSchema.from_file(str(schema_file))
+    target = "/etc/app/app.ini"
+    overrides = [
+        Override(target, "Database", "host", "db.example.com"),
+        Override(target, "Database", "port", 5432),
+        Override(target, "Free", "anything", [1]),
+        Override("/etc/app/other.ini", "Any", "key", "value"),
+        Override(target, "Database", "host", "Not A Host"),
+        Override(target, "Database", "port", "5432"),
+        Override(target, "Database", "user", "admin"),
+        Override(target, "Unknown", "key", "value"),
+    ]
+
+    errors = schema.validate(overrides, "/etc/app")
+
+    assert len(errors) == 4
+    assert "does not match pattern" in errors[0]
+    assert "expected int, got str" in errors[1]
+    assert "key user is not allowed" in errors[2]
+    assert "section [Unknown] is not allowed" in errors[3]
+
+def test_compiled_schema_is_cached(schema_file):
+    first = OverrideSchema.from_file(str(schema_file))
+    assert OverrideSchema.from_file(str(schema_file)) is first
+
+    schema_file.write_text(SCHEMA + "  other.ini:\n")
+    assert OverrideSchema.from_file(str(schema_file)) is not first
+
+def test_invalid_schema(tmp_path):
+    schema_file = tmp_path / "schema.yaml"
+    schema_file.write_text("targets:\n  app.ini:\n    sections:\n      S:\n        keys:\n          k: {type: list}\n")
+    with pytest.raises(ValueError, match="Unknown value type"):
+        OverrideSchema.from_file(str(schema_file))
@@ -0,0 +1,52 @@
+import pytest
+from conf_manager.override.processor import Override
+from conf_manager.override.snapshot import OverrideSnapshot, SnapshotError
+
+SOURCE_HASH = "ab" * 32
+OTHER_HASH = "cd" * 32
+
+@pytest.fixture
+def overrides():
+    return [
+        Override("/etc/app/config.ini", "Section1", "key1", "value1", 0),
+        Override("/etc/app/config.ini", "Database", "port", 5432, 1),
+    ]
+
+def test_snapshot_round_trip(tmp_path, overrides):
+    snapshot = OverrideSnapshot(str(tmp_path / "overrides.snapshot"))
+    snapshot.write(overrides, SOURCE_HASH)
+
+    assert snapshot.load(SOURCE_HASH) == overrides
+
+def test_stale_snapshot(tmp_path, overrides):
+    snapshot = OverrideSnapshot(str(tmp_path / "overrides.snapshot"))
+    snapshot.write(overrides, SOURCE_HASH)
+
+    with pytest.raises(SnapshotError, match="stale"):
+        snapshot.load(OTHER_HASH)
+
+def test_corrupt_snapshot(tmp_path, overrides):
+    snapshot_file = tmp_path / "overrides.snapshot"
+    snapshot = OverrideSnapshot(str(snapshot_file))
+    snapshot.write(overrides, SOURCE_HASH)
+
+    data = bytearray(snapshot_file.read_bytes())
+    data[-1] ^= 0xff
+    snapshot_file.write_bytes(bytes(data))
+    with pytest.raises(SnapshotError, match="corrupt"):
+        snapshot.load(SOURCE_HASH)
+
+    snapshot_file.write_bytes(b"garbage")
+    with pytest.raises(SnapshotError):
+        snapshot.load(SOURCE_HASH)
+
+def test_snapshot_round_trips_dates(tmp_path):
+    import datetime
+    overrides = [
+        Override("/etc/app/config.ini", "Release", "date", datetime.date(2024, 1, 1)),
+        Override("/etc/app/config.ini", "Release", "at", datetime.datetime(2024, 1, 1, 10, 0)),
+    ]
+    snapshot = OverrideSnapshot(str(tmp_path / "overrides.snapshot"))
+    snapshot.write(overrides, SOURCE_HASH)
+
+    assert snapshot.load(SOURCE_HASH) == overrides
@@ -0,0 +1,114 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from conf_manager.override.sources import DirectorySource, HttpConnectionPool, HttpSource, make_source
+
+OVERRIDES = b"overrides:\n  config.ini:\n    Section1:\n      key1: value1\n"
+LAST_MODIFIED = "Mon, 19 Oct 2026 10:00:00 GMT"
+
+class OverrideServer(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), OverrideHandler)
+        self.body = OVERRIDES
+        self.etag = '"v1"'
+        self.requests = []
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/overrides/base.yaml"
+
+class OverrideHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.requests.append((self.client_address, dict(self.headers)))
+        if self.path != '/overrides/base.yaml':
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if self.headers.get('If-None-Match') == self.server.etag:
+            self.send_response(304)
+            self.send_header('ETag', self.server.etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('ETag', self.server.etag)
+        self.send_header('Last-Modified', LAST_MODIFIED)
+        self.send_header('Content-Length', str(len(self.server.body)))
+        self.end_headers()
+        self.wfile.write(self.server.body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def server():
+    server = OverrideServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def test_fetch_and_conditional_get(server, tmp_path):
+    pool = HttpConnectionPool()
+    cache_dir = str(tmp_path / "cache")
+
+    first = HttpSource(server.url, cache_dir, pool)
+    files = first.get_override_files()
+    assert len(files) == 1
+    with open(files[0], 'rb') as f:
+        assert f.read() == OVERRIDES
+
+    # Listing the same source again in one run does not refetch
+    assert first.get_override_files() == files
+    assert len(server.requests) == 1
+
+    # A later run revalidates and gets a 304
+    second = HttpSource(server.url, cache_dir, pool)
+    assert second.get_override_files() == files
+    _, headers = server.requests[-1]
+    assert headers['If-None-Match'] == '"v1"'
+    assert headers['If-Modified-Since'] == LAST_MODIFIED
+
+    # Both requests went over the same pooled connection
+    assert len({client for client, _ in server.requests}) == 1
+    pool.close()
+
+def test_changed_document_is_refetched(server, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    HttpSource(server.url, cache_dir).get_override_files()
+
+    server.body = OVERRIDES.replace(b"value1", b"value2")
+    server.etag = '"v2"'
+    files = HttpSource(server.url, cache_dir).get_override_files()
+
+    with open(files[0], 'rb') as f:
+        assert f.read() == server.body
+
+def test_cached_copy_used_when_server_fails(server, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    files = HttpSource(server.url, cache_dir).get_override_files()
+
+    server.etag = '"v2"'
+    broken = HttpSource(server.url, cache_dir)
+    server.shutdown()
+    server.server_close()
+    assert broken.get_override_files() == files
+
+def test_missing_document_without_cache(server, tmp_path):
+    source = HttpSource(server.url.replace("base.yaml", "missing.yaml"), str(tmp_path / "cache"))
+    with pytest.raises(OSError, match="404"):
+        source.get_override_files()
+
+def test_make_source(tmp_path):
+    assert isinstance(make_source(str(tmp_path)), DirectorySource)
+    assert isinstance(make_source("https://example.com/o.yaml", str(tmp_path)), HttpSource)
+    with pytest.raises(ValueError):
+        make_source("https://example.com/o.yaml")
+
+def test_override_source_is_abstract():
+    from conf_manager.override.sources import OverrideSource
+    with pytest.raises(TypeError):
+        OverrideSource("somewhere")
@@ -0,0 +1,92 @@
+import pytest
+from conf_manager import apply_overrides, build_override_set, OverrideValidationError, TargetResult
+from conf_manager.config.parser import ConfigParser
+
+@pytest.fixture
+def config_dir(tmp_path):
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    (config_dir / "a.ini").write_text("[Section1]\nkey1 = original1\n")
+    (config_dir / "b.yaml").write_text("Section1:\n  key1: original1\n")
+    return config_dir
+
+def test_apply_overrides_from_rows(config_dir):
+    results = apply_overrides(str(config_dir), [
+        ("a.ini", "Section1", "key1", "new_a"),
+        ("a.ini", "Section2", "key2", "added"),
+        ("b.yaml", "Section1", "key1", "new_b"),
+        ("missing.ini", "Section1", "key1", "value"),
+    ])
+
+    assert results == [
+        TargetResult(str(config_dir / "a.ini"), TargetResult.APPLIED, 2),
+        TargetResult(str(config_dir / "b.yaml"), TargetResult.APPLIED, 1),
+        TargetResult(str(config_dir / "missing.ini"), TargetResult.MISSING, 1),
+    ]
+    parser = ConfigParser()
+    assert parser.parse(str(config_dir / "a.ini")) == {
+        'Section1': {'key1': 'new_a'}, 'Section2': {'key2': 'added'}
+    }
+    assert parser.parse(str(config_dir / "b.yaml")) == {'Section1': {'key1': 'new_b'}}
+
+def test_apply_overrides_from_columns(config_dir):
+    results = apply_overrides(str(config_dir), {
+        'target': ["a.ini", "a.ini"],
+        'section': ["Section1", "Section1"],
+        'key': ["key1", "key1"],
+        'value': ["high", "low"],
+        'priority': [2, 1],
+    }, engine='async')
+
+    assert [result.status for result in results] == [TargetResult.APPLIED]
+    assert ConfigParser().parse(str(config_dir / "a.ini")) == {'Section1': {'key1': 'high'}}
+
+def test_dry_run_and_failures(config_dir):
+    (config_dir / "bad.txt").write_text("")
+    results = apply_overrides(str(config_dir), [
+        ("a.ini", "Section1", "key1", "new_a"),
+        ("bad.txt", "Section1", "key1", "value"),
+    ], dry_run=True)
+    assert [result.status for result in results] == [TargetResult.WOULD_APPLY, TargetResult.WOULD_APPLY]
+    assert "key1 = original1" in (config_dir / "a.ini").read_text()
+
+    results = apply_overrides(str(config_dir), [("bad.txt", "Section1", "key1", "value")])
+    assert results[0].failed
+    assert "Unsupported file format" in results[0].error
+
+def test_mismatched_columns(config_dir):
+    with pytest.raises(ValueError):
+        build_override_set(str(config_dir), {
+            'target': ["a.ini"], 'section': ["Section1"], 'key': ["key1", "key2"], 'value': ["v"]
+        })
+
+def test_schema_errors_raise_before_apply(config_dir, tmp_path):
+    schema_file = tmp_path / "schema.yaml"
+    schema_file.write_text("targets:\n  a.ini:\n    sections:\n      Section1:\n")
+    with pytest.raises(OverrideValidationError) as excinfo:
+        apply_overrides(str(config_dir), [
+            ("a.ini", "Section1", "key1", "ok"),
+            ("a.ini", "Other", "key1", "bad"),
+        ], schema_path=str(schema_file))
+    assert len(excinfo.value.errors) == 1
+    assert "key1 = original1" in (config_dir / "a.ini").read_text()
+
+def test_invalid_values_raise_before_apply(config_dir):
+    with pytest.raises(OverrideValidationError) as excinfo:
+        apply_overrides(str(config_dir), [
+            ("a.ini", "Section1", "key1", [1, {'x': 2}]),
+            ("a.ini", "Section1", "key2", None),
+            ("b.yaml", "Section1", "key1", None),
+        ])
+    assert len(excinfo.value.errors) == 2
+    assert "value must be a scalar, got list" in excinfo.value.errors[0]
+    assert "INI targets need a value" in excinfo.value.errors[1]
+    assert (config_dir / "a.ini").read_text() == "[Section1]\nkey1 = original1\n"
+    assert (config_dir / "b.yaml").read_text() == "Section1:\n  key1: original1\n"
+
+def test_rows_of_wrong_length(config_dir):
+    with pytest.raises(ValueError, match="row 1 has 3 field"):
+        build_override_set(str(config_dir), [
+            ("a.ini", "Section1", "key1", "v"),
+            ("a.ini", "Section1", "key2"),
+        ])
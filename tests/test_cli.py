@@ -40,3 +40,56 @@ def test_verbose_flag():
         assert result.exit_code == 0
         # You would need to add assertions here to check for verbose output
         # This might involve checking for specific log messages in the output
+
+def test_convert_command_with_baseline():
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        os.mkdir('override_dir')
+        with open('baseline.conf', 'w') as f:
+            f.write("key1=value1\nkey2=value2")
+        with open('test_config.conf', 'w') as f:
+            f.write("key1=value1\nkey2=custom2")
+
+        result = runner.invoke(cli, ['convert', '--baseline', 'baseline.conf', 'test_config.conf', 'override_dir'])
+        assert result.exit_code == 0
+        with open(os.path.join('override_dir', 'test_config.yml')) as f:
+            assert f.read() == "key2: custom2\n"
+
+def test_compile_command():
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        os.mkdir('override_dir')
+        os.mkdir('config_dir')
+        with open(os.path.join('override_dir', 'override.yaml'), 'w') as f:
+            f.write("overrides:\n  config.ini:\n    Section1:\n      key1: value1\n")
+
+        result = runner.invoke(cli, ['compile', 'override_dir', 'config_dir'])
+        assert result.exit_code == 0
+        assert "Override snapshot written to:" in result.output
+        assert os.path.exists(os.path.join('override_dir', '.overrides.snapshot'))
+
+def test_profile_options():
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        os.mkdir('override_dir')
+        with open('test_config.conf', 'w') as f:
+            f.write("key1=value1\nkey2=value2")
+
+        result = runner.invoke(cli, ['--profile-cpu', 'run.pstats', '--profile-mem', 'run.mem.txt',
+                                     'convert', 'test_config.conf', 'override_dir'])
+        assert result.exit_code == 0
+        assert os.path.getsize('run.pstats') > 0
+        with open('run.mem.txt') as f:
+            assert "Phase: command" in f.read()
+
+def test_compile_command_fails_on_broken_override():
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        os.mkdir('override_dir')
+        os.mkdir('config_dir')
+        with open(os.path.join('override_dir', 'override.yaml'), 'w') as f:
+            f.write("overrides: [unclosed\n")
+
+        result = runner.invoke(cli, ['compile', 'override_dir', 'config_dir'])
+        assert result.exit_code == 1
+        assert not os.path.exists(os.path.join('override_dir', '.overrides.snapshot'))
@@ -0,0 +1,38 @@
+import pstats
+from conf_manager.utils.profiling import Profiler
+
+def build_strings():
+    return ["x" * 100 for _ in range(1000)]
+
+def test_disabled_profiler_is_noop(tmp_path):
+    profiler = Profiler()
+    with profiler.phase('load'):
+        build_strings()
+    profiler.write()
+    assert not profiler.enabled
+    assert list(tmp_path.iterdir()) == []
+
+def test_profiles_selected_phases_only(tmp_path):
+    cpu_file = tmp_path / "run.pstats"
+    mem_file = tmp_path / "run.mem.txt"
+    profiler = Profiler(cpu_file=str(cpu_file), mem_file=str(mem_file), phases=['apply'])
+
+    with profiler.phase('load'):
+        build_strings()
+    with profiler.phase('apply'):
+        build_strings()
+    profiler.write()
+
+    stats = pstats.Stats(str(cpu_file))
+    assert any(func[2] == 'build_strings' for func in stats.stats)
+    report = mem_file.read_text()
+    assert "Phase: apply" in report
+    assert "Phase: load" not in report
+    assert "Top 25 allocations:" in report
+
+def test_nested_phases_are_covered_by_outer(tmp_path):
+    profiler = Profiler(mem_file=str(tmp_path / "run.mem.txt"))
+    with profiler.phase('command'):
+        with profiler.phase('load'):
+            build_strings()
+    assert [name for name, _, _ in profiler.mem_snapshots] == ['command']